@@ -19,11 +19,17 @@ See the [main page] or [github page].
 .. include:: ../docs/examples.md
 
 """
+from . import batch
+from . import cache
 from . import dtypes
+from . import edit
 from . import group
 from . import header
 from . import manager
 from . import parameter
 from . import utils
 from .reader import Reader
+from .async_reader import AsyncReader
 from .writer import Writer
+from .stream_writer import StreamWriter
+from .edit import edit_inplace
@@ -0,0 +1,192 @@
+'''Contains the AsyncReader class for reading C3D files from asynchronous byte sources.'''
+
+import asyncio
+import inspect
+import io
+import warnings
+import numpy as np
+from .manager import Manager
+from .reader import Reader
+
+
+async def _maybe_await(value):
+    '''Await the value if it's awaitable, allowing sources to mix synchronous and asynchronous methods.'''
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+# Metadata attributes and methods provided through the reader parsing the metadata
+_METADATA = frozenset(name for name in dir(Manager) if not name.startswith('_')) | {'proc_type'}
+
+
+class AsyncReader(object):
+    '''This class provides methods for reading C3D files from asynchronous byte sources.
+
+    The header and parameter section are read when the reader is opened, data
+    frames are read in blocks using `AsyncReader.read_blocks()`. I/O is awaited,
+    while decoding is offloaded to a thread, so the event loop is never blocked.
+    Metadata is available through the attributes and methods of a `c3d.manager.Manager`
+    (such as `point_rate`, `point_labels` and `get()`), methods reading data frames
+    of a `c3d.reader.Reader` are not provided.
+
+    >>> reader = await c3d.AsyncReader.open(source)
+    >>> async for frame_nos, points, analog in reader.read_blocks(1000):
+    ...     print('frames {} to {}'.format(frame_nos[0], frame_nos[-1]))
+    '''
+
+    def __init__(self, source, metadata, lazy=False):
+        '''Initialize the reader from a source and the metadata read from the source.
+
+        Use `AsyncReader.open()` to create a reader.
+
+        Parameters
+        ----------
+        source : async byte source
+            Source providing an awaitable `read(n)`, see `AsyncReader.open()`.
+        metadata : bytes
+            Bytes preceding and including the parameter section of the file.
+        lazy : bool, default=False
+            See `c3d.reader.Reader`.
+        '''
+        self._reader = Reader(io.BytesIO(metadata), lazy=lazy)
+        self._source = source
+        self._position = len(metadata)
+
+    def __getattr__(self, name):
+        if name in _METADATA:
+            return getattr(self._reader, name)
+        raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+
+    @staticmethod
+    async def open(source, lazy=False):
+        '''Read the header and parameter section of a C3D file from an asynchronous byte source.
+
+        Parameters
+        ----------
+        source : async byte source
+            Object with an awaitable `read(n)` method, returning at most n bytes
+            and an empty bytes object at the end of the stream. If the source has a
+            `seek(offset)` method (awaitable or not) it's used to move to the data
+            section, otherwise data between the sections is read and discarded.
+            The source is assumed to be positioned at the start of the file.
+        lazy : bool, default=False
+            See `c3d.reader.Reader`.
+
+        Returns
+        -------
+        reader : `c3d.async_reader.AsyncReader`
+            Reader instance with the parsed metadata.
+        '''
+        metadata = await AsyncReader._read_exact(source, 512)
+        parameter_start = (metadata[0] - 1) * 512 if metadata else 0
+        metadata += await AsyncReader._read_exact(source, parameter_start + 4 - len(metadata))
+        parameter_blocks = metadata[-2] if len(metadata) >= 4 else 0
+        metadata += await AsyncReader._read_exact(source, 512 * parameter_blocks - 4)
+        return AsyncReader(source, metadata, lazy=lazy)
+
+    @staticmethod
+    async def _read_exact(source, size):
+        '''Read up to size bytes from the source, fewer bytes are only returned at the end of the stream.'''
+        chunks = []
+        while size > 0:
+            chunk = await _maybe_await(source.read(size))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b''.join(chunks)
+
+    async def _read_at(self, offset, size):
+        '''Read up to size bytes from the given offset in the source.'''
+        if offset != self._position:
+            if hasattr(self._source, 'seek'):
+                await _maybe_await(self._source.seek(offset))
+            elif offset > self._position:
+                # Forward-only source, discard bytes until the offset is reached
+                skipped = await AsyncReader._read_exact(self._source, offset - self._position)
+                if len(skipped) < offset - self._position:
+                    self._position += len(skipped)
+                    return b''
+            else:
+                raise io.UnsupportedOperation('Source does not support seeking backwards to byte {}.'.format(offset))
+            self._position = offset
+        data = await AsyncReader._read_exact(self._source, size)
+        self._position += len(data)
+        return data
+
+    async def read_blocks(self, frames_per_block=4096, analog_transform=True, check_nan=True, camera_sum=False,
+                          start=None, stop=None, points=None, analog=None, camera_mask=False,
+                          points_dtype=np.float32, analog_dtype=float):
+        '''Iterate asynchronously over blocks of consecutive data frames.
+
+        Blocks are equivalent to the blocks generated by `c3d.reader.Reader.read_blocks()`,
+        see the method for a description of the arguments.
+
+        Returns
+        -------
+        blocks : async generator of (frame numbers, points, analog)
+            Blocks of decoded frames, see `c3d.reader.Reader.read_blocks()`.
+        '''
+        if frames_per_block < 1:
+            raise ValueError('Expected frames per block to be a positive integer, was {}.'.format(frames_per_block))
+        reader = self._reader
+        point_index = reader._column_index(points, 'POINT')
+        analog_index = reader._column_index(analog, 'ANALOG')
+        points_dtype, analog_dtype = reader._output_dtypes(points_dtype, analog_dtype, analog_transform, analog_index)
+        point_shape, analog_shape = reader._output_shapes(point_index, analog_index, camera_mask=camera_mask)
+
+        frames = reader._frame_range(start, stop)
+        frame_dtype = reader._frame_dtype()
+        frame_bytes = frame_dtype.itemsize
+        offset = (reader._header.data_block - 1) * 512 + (frames.start - self.first_frame) * frame_bytes
+        for i in range(0, len(frames), frames_per_block):
+            count = min(frames_per_block, len(frames) - i)
+            raw_bytes = await self._read_at(offset, count * frame_bytes)
+            offset += len(raw_bytes)
+            truncated = len(raw_bytes) < count * frame_bytes
+            if truncated:
+                # Only provide complete frames
+                count = len(raw_bytes) // frame_bytes if frame_bytes > 0 else 0
+                warnings.warn('''reached end of file (EOF) while reading data at frame index {}
+                                 and file pointer {}!'''.format(frames.start + i + count - self.first_frame,
+                                                               self._position))
+                if count == 0:
+                    return
+            raw = np.frombuffer(raw_bytes, dtype=frame_dtype, count=count)
+
+            frame_nos = np.arange(frames.start + i, frames.start + i + count)
+            block_points = np.zeros((count,) + point_shape, points_dtype)
+            block_analog = np.empty((count,) + analog_shape, analog_dtype)
+            cameras = np.zeros(block_points.shape[:-1], np.uint8) if camera_mask else None
+            await asyncio.get_running_loop().run_in_executor(
+                None, reader._decode_frames, raw, block_points, block_analog, cameras, point_index, analog_index,
+                analog_transform, check_nan, camera_sum)
+            if camera_mask:
+                yield frame_nos, block_points, block_analog, cameras
+            else:
+                yield frame_nos, block_points, block_analog
+            if truncated:
+                return
+
+    async def read_all(self, analog_transform=True, check_nan=True, camera_sum=False, points=None, analog=None,
+                       camera_mask=False, points_dtype=np.float32, analog_dtype=float):
+        '''Read and decode every data frame in the file.
+
+        See `c3d.reader.Reader.read_all()` for a description of the arguments and returned arrays.
+        '''
+        blocks = [block async for block in self.read_blocks(
+            max(self.frame_count, 1), analog_transform, check_nan, camera_sum,
+            points=points, analog=analog, camera_mask=camera_mask, points_dtype=points_dtype,
+            analog_dtype=analog_dtype)]
+        if blocks:
+            return blocks[0][1:]
+        reader = self._reader
+        analog_index = reader._column_index(analog, 'ANALOG')
+        point_shape, analog_shape = reader._output_shapes(reader._column_index(points, 'POINT'), analog_index,
+                                                          0, camera_mask)
+        points_dtype, analog_dtype = reader._output_dtypes(points_dtype, analog_dtype, analog_transform, analog_index)
+        empty = np.zeros(point_shape, points_dtype), np.empty(analog_shape, analog_dtype)
+        if camera_mask:
+            return empty + (np.zeros(point_shape[:-1], np.uint8),)
+        return empty
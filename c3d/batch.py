@@ -0,0 +1,237 @@
+'''Contains functions for loading batches of C3D files using a pool of processes.'''
+
+import concurrent.futures
+import itertools
+import os
+import warnings
+import numpy as np
+from multiprocessing import resource_tracker, shared_memory
+from .manager import Manager
+from .reader import Reader
+
+
+class LoadResult(object):
+    '''Result of loading a single C3D file using `c3d.batch.load_many`.
+
+    Attributes
+    ----------
+    path : str
+        Path to the loaded file.
+    metadata : `c3d.manager.Manager`
+        Header and parameter groups of the file, None if the file could not be read.
+    points : (N, P, 5) numpy array
+        Point data decoded as in `c3d.reader.Reader.read_all`, None if only
+        metadata was loaded or if an error occurred.
+    analog : (N, C, S) numpy array
+        Analog data decoded as in `c3d.reader.Reader.read_all`, or None.
+    error : Exception
+        Exception raised while loading the file, None if the file was loaded.
+    warnings : list of str
+        Warning messages issued while loading the file.
+    '''
+
+    def __init__(self, path, metadata=None, points=None, analog=None, error=None, warnings=None):
+        self.path = path
+        self.metadata = metadata
+        self.points = points
+        self.analog = analog
+        self.error = error
+        self.warnings = warnings or []
+
+    def __repr__(self):
+        if self.error is not None:
+            return '<LoadResult: {} ({})>'.format(self.path, repr(self.error))
+        return '<LoadResult: {}>'.format(self.path)
+
+    @property
+    def ok(self) -> bool:
+        '''True if the file was loaded without errors.'''
+        return self.error is None
+
+
+def load_many(paths, workers=None, columns=None, metadata_only=False,
+              analog_transform=True, check_nan=True, camera_sum=False, points_dtype=np.float32, analog_dtype=float):
+    '''Load a collection of C3D files using a pool of processes.
+
+    Each file is read by a worker process using `c3d.reader.Reader.read_all`, so
+    decoded data is identical to reading the files one by one. Decoded arrays are
+    returned to the calling process through shared memory blocks created by the
+    calling process, rather than pickled.
+
+    Parameters
+    ----------
+    paths : iterable of str
+        Paths to the C3D files to load.
+    workers : int, optional
+        Number of worker processes, defaults to the number of processors on the machine.
+        At most twice as many files are loaded ahead of the results consumed, limiting
+        the shared memory held by results not yet generated.
+    columns : dict, optional
+        Selection of the columns to decode, with the keys 'points' and/or 'analog'
+        mapping to the POINT:LABELS and ANALOG:LABELS entries (or indices) to decode.
+        See the `points` and `analog` arguments of `c3d.reader.Reader.read_frames`.
+    metadata_only : bool, default=False
+        If True, only the header and parameter section of each file is read.
+    analog_transform, check_nan, camera_sum : bool
+        See `c3d.reader.Reader.read_frames`.
+    points_dtype, analog_dtype : numpy dtype
+        Data types of the decoded arrays, see `c3d.reader.Reader.read_frames`.
+
+    Returns
+    -------
+    results : generator of `c3d.batch.LoadResult`
+        One result per file, generated in the order the files finish loading.
+        Errors raised while loading a file are captured in `LoadResult.error`
+        rather than raised.
+
+    Example
+    -------
+    >>> for result in c3d.batch.load_many(glob.glob('trials/*.c3d'), workers=8):
+    ...     if result.ok:
+    ...         print(result.path, result.metadata.point_rate, result.points.shape)
+    '''
+    columns = columns or {}
+    unknown = set(columns) - {'points', 'analog'}
+    if unknown:
+        raise ValueError("Expected columns to only contain the keys 'points' and 'analog', got {}.".format(
+            ', '.join(sorted(unknown))))
+    options = dict(points=columns.get('points'), analog=columns.get('analog'), analog_transform=analog_transform,
+                   check_nan=check_nan, camera_sum=camera_sum, points_dtype=points_dtype, analog_dtype=analog_dtype)
+
+    workers = workers or os.cpu_count() or 1
+    if os.name != 'nt':
+        # Blocks attached to by the workers are registered with the resource tracker of the
+        # process starting them, start it before the workers so they share this process's tracker
+        resource_tracker.ensure_running()
+    pool = concurrent.futures.ProcessPoolExecutor(workers)
+    paths = iter(paths)
+    # Futures of the files in flight, mapped to their paths and, while the data section
+    # is decoded, the metadata of the file and the shared memory block decoded into
+    pending = {}
+
+    def submit():
+        for path in itertools.islice(paths, 2 * workers - len(pending)):
+            pending[pool.submit(_load_metadata, path, metadata_only, options)] = path, None
+
+    try:
+        submit()
+        while pending:
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                path, loading = pending.pop(future)
+                try:
+                    if loading is None:
+                        metadata, layout, messages = future.result()
+                        if layout is not None:
+                            # The block is owned by this process, and kept until the worker decoded into it
+                            shm = shared_memory.SharedMemory(create=True, size=max(_shared_size(*layout), 1))
+                            pending[pool.submit(_load_data, path, shm.name, layout, options)] = \
+                                path, (metadata, shm, layout, messages)
+                            continue
+                        result = LoadResult(path, metadata, warnings=messages)
+                    else:
+                        metadata, shm, layout, messages = loading
+                        try:
+                            # Skip warnings repeated when the data section is mapped again for decoding
+                            messages = messages + [m for m in future.result() if m not in messages]
+                            points, analog = _copy_shared(shm, *layout)
+                        finally:
+                            shm.close()
+                            shm.unlink()
+                        result = LoadResult(path, metadata, points, analog, warnings=messages)
+                except Exception as e:
+                    result = LoadResult(path, error=e)
+                submit()
+                yield result
+    finally:
+        # Release shared memory of files not consumed, if the generator was closed early
+        pool.shutdown(cancel_futures=True)
+        for path, loading in pending.values():
+            if loading is not None:
+                loading[1].close()
+                loading[1].unlink()
+
+
+def _load_metadata(path, metadata_only, options):
+    '''Read the metadata of a single file in a worker process.
+
+    Returns
+    -------
+    metadata : `c3d.manager.Manager`
+        Header and parameter groups of the file.
+    layout : tuple or None
+        Shapes and data types of the point and analog arrays, or None if only metadata is loaded.
+    warnings : list of str
+        Messages of the warnings issued while reading the file.
+    '''
+    with warnings.catch_warnings(record=True) as messages, open(path, 'rb') as handle:
+        warnings.simplefilter('always')
+        reader = Reader(handle, mmap=True, lazy=True)
+        metadata = Manager(reader.header)
+        metadata._dtypes = reader._dtypes
+        metadata._groups = reader._groups
+        if metadata_only:
+            return metadata, None, [str(m.message) for m in messages]
+
+        point_index = reader._column_index(options['points'], 'POINT')
+        analog_index = reader._column_index(options['analog'], 'ANALOG')
+        point_shape, analog_shape = reader._output_shapes(point_index, analog_index, len(reader.raw_frames()))
+        dtypes = reader._output_dtypes(options['points_dtype'], options['analog_dtype'], options['analog_transform'],
+                                       analog_index)
+        return metadata, (point_shape, analog_shape) + dtypes, [str(m.message) for m in messages]
+
+
+def _load_data(path, name, layout, options):
+    '''Decode the data section of a single file in a worker process.
+
+    The data is decoded into the shared memory block `name`, created and released
+    by the calling process, see `_load_metadata()` for the layout.
+
+    Returns
+    -------
+    warnings : list of str
+        Messages of the warnings issued while reading the data section.
+    '''
+    with open(path, 'rb') as handle:
+        with warnings.catch_warnings():
+            # Warnings issued while reading the metadata are returned by _load_metadata()
+            warnings.simplefilter('ignore')
+            reader = Reader(handle, mmap=True, lazy=True)
+        with warnings.catch_warnings(record=True) as messages:
+            warnings.simplefilter('always')
+            shm = shared_memory.SharedMemory(name=name)
+            try:
+                _decode_shared(reader, shm, layout, options)
+            finally:
+                shm.close()
+        return [str(m.message) for m in messages]
+
+
+def _decode_shared(reader, shm, layout, options):
+    '''Decode the data section of a reader into a shared memory block.'''
+    points, analog = _shared_arrays(shm, *layout)
+    reader.read_all(out_points=points, out_analog=analog, **options)
+
+
+def _analog_offset(point_shape, point_dtype):
+    '''Byte offset of the analog array in a shared memory block, aligned to 8 bytes.'''
+    return -(-int(np.prod(point_shape)) * np.dtype(point_dtype).itemsize // 8) * 8
+
+
+def _shared_size(point_shape, analog_shape, point_dtype=np.float32, analog_dtype=np.float64):
+    '''Number of bytes required to store point and analog arrays of the given shapes and data types.'''
+    return _analog_offset(point_shape, point_dtype) + int(np.prod(analog_shape)) * np.dtype(analog_dtype).itemsize
+
+
+def _shared_arrays(shm, point_shape, analog_shape, point_dtype=np.float32, analog_dtype=np.float64):
+    '''Get (points, analog) arrays backed by a shared memory block.'''
+    points = np.ndarray(point_shape, dtype=point_dtype, buffer=shm.buf)
+    analog = np.ndarray(analog_shape, dtype=analog_dtype, buffer=shm.buf,
+                        offset=_analog_offset(point_shape, point_dtype))
+    return points, analog
+
+
+def _copy_shared(shm, *layout):
+    '''Copy (points, analog) arrays out of a shared memory block.'''
+    points, analog = _shared_arrays(shm, *layout)
+    return points.copy(), analog.copy()
@@ -0,0 +1,248 @@
+'''Contains the Cache and BlockCache classes for caching decoded C3D data on disk and in memory.'''
+
+import collections
+import hashlib
+import os
+import shutil
+import tempfile
+import numpy as np
+
+# Names of the arrays stored for each cache entry, in the order returned by `Reader.read_all()`.
+_ARRAYS = ('points', 'analog', 'cameras')
+
+
+class Cache(object):
+    '''On-disk cache of decoded point and analog data, used to speed up repeated loads of the same files.
+
+    Each entry is a directory of `.npy` files holding the arrays decoded by
+    `c3d.reader.Reader.read_all()` and the metadata (header and parameter section)
+    of the file the arrays were decoded from. Entries are keyed on the path, size
+    and modification time of the file, a hash of the metadata and the arguments used
+    to decode the data, so modified files are never served from the cache. Arrays
+    are memory-mapped when loaded from the cache.
+
+    When the total size of the entries exceeds `max_bytes`, the least recently used
+    entries are removed.
+
+    >>> cache = c3d.cache.Cache('~/.cache/c3d', max_bytes=2**30)
+    >>> points, analog = c3d.Reader(open('capture.c3d', 'rb'), cache=cache).read_all()
+    '''
+
+    def __init__(self, directory=None, max_bytes=4 * 2**30):
+        '''Initialize a cache stored in a directory.
+
+        Parameters
+        ----------
+        directory : str, optional
+            Directory entries are stored in, created if it doesn't exist. Defaults to
+            'c3d-cache' in the temporary directory of the system.
+        max_bytes : int, default=4 GiB
+            Maximum total size of the cached entries in bytes.
+        '''
+        if directory is None:
+            directory = os.path.join(tempfile.gettempdir(), 'c3d-cache')
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __repr__(self):
+        return '<Cache: {} ({} of {} bytes)>'.format(self.directory, self.size, self.max_bytes)
+
+    @property
+    def size(self) -> int:
+        '''Total size of the cached entries in bytes.'''
+        return sum(size for _, _, size in self._entries())
+
+    def file_key(self, handle, metadata_size):
+        '''Get the key identifying the content of an open C3D file.
+
+        Parameters
+        ----------
+        handle : file
+            Handle of a file on disk, the position of the handle is changed.
+        metadata_size : int
+            Number of bytes preceding the data section of the file, i.e. the header
+            and parameter section.
+
+        Returns
+        -------
+        key : str or None
+            Hexadecimal key, None if the handle isn't associated with a file on disk.
+        '''
+        name = getattr(handle, 'name', None)
+        if not isinstance(name, str):
+            return None
+        try:
+            stat = os.fstat(handle.fileno())
+        except (AttributeError, OSError, ValueError):
+            return None
+        digest = hashlib.sha1('{}\0{}\0{}\0'.format(os.path.realpath(name), stat.st_size,
+                                                     stat.st_mtime_ns).encode())
+        handle.seek(0)
+        digest.update(handle.read(metadata_size))
+        return digest.hexdigest()
+
+    def load(self, file_key, options):
+        '''Load the arrays decoded from a file using a set of options.
+
+        Parameters
+        ----------
+        file_key : str
+            Key of the file, see `Cache.file_key()`.
+        options : dict
+            Arguments used to decode the data.
+
+        Returns
+        -------
+        arrays : tuple of numpy arrays or None
+            Copy-on-write memory-mapped (points, analog[, cameras]) arrays, None if not cached.
+        '''
+        path = self._entry_path(file_key, options)
+        arrays = []
+        for name in _ARRAYS:
+            fn = os.path.join(path, name + '.npy')
+            if name == 'cameras' and not options.get('camera_mask'):
+                continue
+            try:
+                arrays.append(np.load(fn, mmap_mode='c'))
+            except ValueError:
+                # Arrays of size 0 can't be memory-mapped
+                arrays.append(np.load(fn))
+            except OSError:
+                return None
+        # Mark the entry as recently used
+        os.utime(path)
+        return tuple(arrays)
+
+    def store(self, file_key, options, arrays, metadata):
+        '''Store the arrays decoded from a file, evicting the least recently used entries if the cache is full.
+
+        Parameters
+        ----------
+        file_key : str
+            Key of the file, see `Cache.file_key()`.
+        options : dict
+            Arguments used to decode the data.
+        arrays : tuple of numpy arrays
+            Decoded (points, analog[, cameras]) arrays.
+        metadata : bytes
+            Header and parameter section of the file.
+        '''
+        path = self._entry_path(file_key, options)
+        if os.path.isdir(path):
+            return
+        # Write to a temporary directory first, so partially written entries are never loaded
+        staging = tempfile.mkdtemp(prefix='.tmp-', dir=self.directory)
+        try:
+            for name, array in zip(_ARRAYS, arrays):
+                np.save(os.path.join(staging, name + '.npy'), array)
+            np.save(os.path.join(staging, 'metadata.npy'), np.frombuffer(metadata, np.uint8))
+            os.rename(staging, path)
+        except OSError:
+            # Entry added by another process, or the cache directory is not writable
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+        self.evict()
+
+    def evict(self, max_bytes=None):
+        '''Remove the least recently used entries until the total size is at most `max_bytes`.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Size limit in bytes, defaults to `Cache.max_bytes`.
+        '''
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if total <= max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        '''Remove all entries from the cache.'''
+        self.evict(0)
+
+    def _entry_path(self, file_key, options):
+        '''Get the directory of the entry for a file decoded using a set of options.'''
+        options = sorted((k, v.tolist() if isinstance(v, np.ndarray) else str(v)) for k, v in options.items())
+        digest = hashlib.sha1('{}\0{}'.format(file_key, options).encode())
+        return os.path.join(self.directory, digest.hexdigest())
+
+    def _entries(self):
+        '''Get a list of (last access time, path, size in bytes) tuples for the cached entries.'''
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith('.') or not entry.is_dir():
+                continue
+            try:
+                size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                entries.append((entry.stat().st_mtime_ns, entry.path, size))
+            except OSError:
+                # Entry removed by another process
+                continue
+        return entries
+
+
+class BlockCache(object):
+    '''In-memory cache of decoded blocks of consecutive frames, evicting the least recently used blocks.
+
+    Used by `c3d.reader.Reader.frame()` and indexing a reader, so frames near a
+    previously visited frame are returned without reading or decoding the file.
+
+    >>> reader = c3d.Reader(open('capture.c3d', 'rb'), block_cache=c3d.cache.BlockCache(2**28))
+    >>> points, analog = reader.frame(1000)  # Decodes the block containing frame 1000
+    >>> points, analog = reader[990:1010]    # Served from the cached block
+    '''
+
+    def __init__(self, max_bytes=2**28, frames_per_block=256):
+        '''Initialize an empty cache.
+
+        Parameters
+        ----------
+        max_bytes : int, default=256 MiB
+            Maximum total size of the cached blocks in bytes.
+        frames_per_block : int, default=256
+            Number of frames in each cached block.
+        '''
+        if frames_per_block < 1:
+            raise ValueError('Expected frames per block to be a positive integer, was {}.'.format(frames_per_block))
+        self.max_bytes = max_bytes
+        self.frames_per_block = frames_per_block
+        self._blocks = collections.OrderedDict()
+        self._size = 0
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def __repr__(self):
+        return '<BlockCache: {} blocks ({} of {} bytes)>'.format(len(self._blocks), self._size, self.max_bytes)
+
+    @property
+    def size(self) -> int:
+        '''Total size of the cached blocks in bytes.'''
+        return self._size
+
+    def get(self, key):
+        '''Get the arrays of a cached block, or None if the block isn't cached.'''
+        arrays = self._blocks.get(key)
+        if arrays is not None:
+            self._blocks.move_to_end(key)
+        return arrays
+
+    def put(self, key, arrays):
+        '''Add the arrays of a decoded block, evicting the least recently used blocks if the cache is full.'''
+        if key in self._blocks:
+            self._size -= sum(a.nbytes for a in self._blocks.pop(key))
+        self._blocks[key] = arrays
+        self._size += sum(a.nbytes for a in arrays)
+        while self._size > self.max_bytes and len(self._blocks) > 1:
+            _, evicted = self._blocks.popitem(last=False)
+            self._size -= sum(a.nbytes for a in evicted)
+
+    def clear(self):
+        '''Remove all blocks from the cache.'''
+        self._blocks.clear()
+        self._size = 0
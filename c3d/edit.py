@@ -0,0 +1,141 @@
+'''Contains the edit_inplace function for editing the metadata of C3D files in place.'''
+
+import contextlib
+import io
+import os
+import shutil
+import struct
+import tempfile
+from .reader import Reader
+from .writer import Writer
+
+
+@contextlib.contextmanager
+def edit_inplace(path, rewrite=True):
+    '''Edit the header and parameters of a C3D file in place.
+
+    The file is opened for reading and writing and the metadata is provided as a
+    `c3d.writer.Writer`, so groups and parameters are edited through the regular
+    `c3d.group.Group` and `c3d.parameter.Param` methods. When the context exits,
+    the parameter section is serialized and, if it fits in the blocks preceding
+    the data section, only the header and parameter blocks are rewritten. The
+    file is not modified if the metadata is unchanged or if an error is raised
+    within the context.
+
+    If the parameter section outgrows the blocks preceding the data section (or if
+    parameters used to encode the frames, such as POINT:SCALE, are modified) the
+    file is rewritten as if written by `c3d.writer.Writer.from_reader()` using the
+    'passthrough' mode, moving the data section.
+
+    Parameters
+    ----------
+    path : str
+        Path to an Intel formatted C3D file.
+    rewrite : bool, default=True
+        If False, a ValueError is raised rather than rewriting the file when the
+        parameter section can't be rewritten in place.
+
+    Returns
+    -------
+    writer : context manager of `c3d.writer.Writer`
+        Writer containing a copy of the metadata of the file.
+
+    Raises
+    ------
+    ValueError
+        If the file isn't Intel formatted, or if the file has to be rewritten and
+        `rewrite` is False.
+
+    Example
+    -------
+    >>> with c3d.edit_inplace('capture.c3d') as writer:
+    ...     writer.point_group.set_str('UNITS', 'Units used for point data measurements.', 'm')
+    '''
+    with open(path, 'r+b') as handle:
+        writer = Writer.from_reader(Reader(handle), 'passthrough')
+        # Compare against the metadata as written, so an unchanged file isn't modified
+        _set_data_metadata(writer)
+        metadata = _header_bytes(writer), _parameter_bytes(writer)
+        yield writer
+
+        if _write_metadata(writer, handle, *metadata):
+            return
+        if not rewrite:
+            raise ValueError('Editing the metadata of {} requires the file to be rewritten.'.format(path))
+        # Write a new file next to the original, replacing the original once complete
+        fd, temp = tempfile.mkstemp(suffix='.c3d', dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                writer.write(out)
+            # mkstemp creates files readable only by the owner, keep the permissions of the original
+            shutil.copymode(path, temp)
+        except BaseException:
+            os.remove(temp)
+            raise
+    os.replace(temp, path)
+
+
+def _header_bytes(manager):
+    '''Serialize the header of a manager.'''
+    h = io.BytesIO()
+    manager.header.write(h)
+    return h.getvalue()
+
+
+def _parameter_bytes(manager):
+    '''Serialize the groups and parameters of a manager.'''
+    h = io.BytesIO()
+    for group_id, group in manager.listed():
+        group._data.write(group_id, h)
+    return h.getvalue()
+
+
+def _set_data_metadata(writer):
+    '''Set the parameters and header entries describing the data section of the source file.'''
+    source = writer._source
+    writer._set_frame_metadata(source.point_used, (source.analog_used, source.analog_per_frame), source.frame_count)
+    writer._set_data_start(source.header.data_block)
+
+
+def _write_metadata(writer, handle, header, parameters):
+    '''Rewrite the header and parameter section of a file in place, if possible.
+
+    Parameters
+    ----------
+    writer : `c3d.writer.Writer`
+        Writer created from a reader of the file in 'passthrough' mode.
+    handle : file
+        Handle of the file, opened for reading and writing.
+    header, parameters : bytes
+        Serialized header and parameters of the file when opened, sections are only written if modified.
+
+    Returns
+    -------
+    written : bool
+        True if the metadata was written (or is unchanged), False if the file has to be rewritten.
+    '''
+    source = writer._source
+    if source is None or writer._encoding_parameters() != writer._source_encoding:
+        # Frames were added or have to be encoded
+        return False
+    parameter_block, data_block = source.header.parameter_block, source.header.data_block
+    if writer.header.parameter_block != parameter_block:
+        return False
+    _set_data_metadata(writer)
+    section = _parameter_bytes(writer)
+    available = data_block - parameter_block
+    blocks = -(-(4 + len(section)) // 512)
+    if blocks > available:
+        return False
+
+    if section != parameters:
+        # Keep the first two bytes of the parameter section header, which are ignored by readers
+        start = (parameter_block - 1) * 512
+        handle.seek(start)
+        section = handle.read(2) + struct.pack('BB', blocks, writer._dtypes.processor) + section
+        handle.seek(start)
+        handle.write(section.ljust(available * 512, b'\x00'))
+    if _header_bytes(writer) != header:
+        writer.header.write(handle)
+    handle.flush()
+    return True
@@ -7,6 +7,100 @@ from .group import GroupData, GroupReadonly, Group
 from .utils import is_integer, is_iterable
 
 
+class AnalogTransform(object):
+    '''Scale and offset transform between analog words stored in a file and analog values.
+
+    Values are computed from the stored words as `(word - offset) * scale` for each
+    channel, where the scale is the product of ANALOG:SCALE and ANALOG:GEN_SCALE.
+    Parameters are stored per channel and applied to arrays of shape (..., C, S),
+    without broadcasting the parameters to the full shape of the data.
+
+    Attributes
+    ----------
+    scales : (C,) numpy array
+        Scale factor for each channel, including the general scale factor.
+    offsets : (C,) numpy array
+        Offset for each channel.
+    is_identity : bool
+        True if the transform leaves the data unchanged, in which case it's skipped.
+    '''
+
+    def __init__(self, scales, offsets):
+        self.scales = np.asarray(scales, float)
+        self.offsets = np.asarray(offsets, float)
+        self._apply_offset = bool(np.any(self.offsets != 0))
+        self._apply_scale = bool(np.any(self.scales != 1))
+
+    @staticmethod
+    def from_manager(manager):
+        '''Get the analog transform defined by the ANALOG parameters of a `c3d.manager.Manager`.'''
+        gen_scale, analog_scales, analog_offsets = manager.get_analog_transform_parameters()
+        return AnalogTransform(analog_scales * gen_scale, analog_offsets)
+
+    @property
+    def is_identity(self) -> bool:
+        return not (self._apply_offset or self._apply_scale)
+
+    def select(self, channels):
+        '''Get the transform for a subset of channels, or the transform itself if channels is None.'''
+        if channels is None:
+            return self
+        return AnalogTransform(self.scales[channels], self.offsets[channels])
+
+    def apply(self, raw, out=None):
+        '''Transform analog words into analog values.
+
+        The words are converted, offset and scaled in at most two passes over the
+        output array, without creating temporary arrays.
+
+        Parameters
+        ----------
+        raw : (..., C, S) numpy array
+            Analog words, may be a (non-contiguous) view of a data section.
+        out : (..., C, S) numpy array, optional
+            Output array, may be `raw` to transform the words in place.
+
+        Returns
+        -------
+        analog : (..., C, S) numpy array
+            Transformed analog values, `out` if given.
+        '''
+        if out is None:
+            out = np.empty(np.shape(raw), float)
+        if self._apply_offset:
+            np.subtract(raw, self.offsets[:, np.newaxis], out=out)
+        elif out is not raw:
+            out[...] = raw
+        if self._apply_scale:
+            np.multiply(out, self.scales[:, np.newaxis], out=out)
+        return out
+
+    def invert(self, analog, out=None):
+        '''Transform analog values into (unrounded) analog words, the inverse of `AnalogTransform.apply()`.
+
+        Parameters
+        ----------
+        analog : (..., C, S) numpy array
+            Analog values.
+        out : (..., C, S) numpy array, optional
+            Output array, may be `analog` to transform the values in place.
+
+        Returns
+        -------
+        words : (..., C, S) numpy array
+            Analog words, `out` if given.
+        '''
+        if out is None:
+            out = np.empty(np.shape(analog), float)
+        if self._apply_scale:
+            np.multiply(analog, 1.0 / self.scales[:, np.newaxis], out=out)
+        elif out is not analog:
+            out[...] = analog
+        # Offsets are added even if zero, as the addition normalizes -0.0 to 0.0
+        np.add(out, self.offsets[:, np.newaxis], out=out)
+        return out
+
+
 class Manager(object):
     '''A base class for managing C3D file metadata.
 
@@ -24,6 +118,7 @@ class Manager(object):
         '''Set up a new Manager with a Header.'''
         self._header = header or Header()
         self._groups = {}
+        self._label_indices = {}
 
     def __contains__(self, key):
         return key in self._groups
@@ -324,6 +419,55 @@ class Manager(object):
         ''' Labels for each ANALOG data channel. '''
         return self.get('ANALOG:LABELS').string_array
 
+    def point_index(self, label) -> int:
+        '''Get the index of the point with a label, i.e. the column of the point in decoded point data.
+
+        Parameters
+        ----------
+        label : str
+            POINT:LABELS entry, leading and trailing whitespace is ignored.
+
+        Raises
+        ------
+        KeyError
+            If no POINT:LABELS entry matched the label.
+        '''
+        return self._label_index('POINT', label)
+
+    def analog_index(self, label) -> int:
+        '''Get the index of the analog channel with a label, i.e. the channel in decoded analog data.
+
+        Parameters
+        ----------
+        label : str
+            ANALOG:LABELS entry, leading and trailing whitespace is ignored.
+
+        Raises
+        ------
+        KeyError
+            If no ANALOG:LABELS entry matched the label.
+        '''
+        return self._label_index('ANALOG', label)
+
+    def _label_index(self, group, label):
+        '''Look up the column index of a label in the LABELS parameter of the POINT or ANALOG group.
+
+        The label to index mapping is cached, and rebuilt if the LABELS parameter or
+        the number of used columns changes. If labels repeat, the first entry is used.
+        '''
+        param = self.get(group + ':LABELS')
+        count = self.point_used if group == 'POINT' else self.analog_used
+        data = None if param is None else param.bytes_value
+        cached = self._label_indices.get(group)
+        if cached is None or cached[0] is not data or cached[1] != count:
+            labels = np.array([], str) if param is None else param.string_array.reshape(-1)[:count].astype(str)
+            indices = {label: i for i, label in reversed(list(enumerate(np.char.strip(labels).tolist())))}
+            cached = self._label_indices[group] = (data, count, indices)
+        try:
+            return cached[2][label.strip()]
+        except KeyError:
+            raise KeyError('No {} label matched {}.'.format(group, label))
+
     @property
     def frame_count(self) -> int:
         ''' Number of frames recorded in the data. '''
@@ -455,6 +599,8 @@ class Manager(object):
 
     def get_analog_transform(self):
         ''' Get broadcastable analog transformation parameters.
+
+        See `c3d.manager.AnalogTransform` for applying the transform to analog data.
         '''
         gen_scale, analog_scales, analog_offsets = self.get_analog_transform_parameters()
         analog_scales *= gen_scale
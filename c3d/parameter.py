@@ -1,5 +1,6 @@
 ''' Classes used to represent the concept of a parameter in a .c3d file.
 '''
+import io
 import struct
 import numpy as np
 from .utils import DEC_to_IEEE, DEC_to_IEEE_BYTES
@@ -28,6 +29,9 @@ class ParamData(object):
         Raw data for this parameter.
     '''
 
+    # Attributes parsed from the binary representation of the parameter.
+    _PARSED = ('desc', 'bytes_per_element', 'dimensions', 'bytes')
+
     def __init__(self,
                  name,
                  dtype,
@@ -35,10 +39,19 @@ class ParamData(object):
                  bytes_per_element=1,
                  dimensions=None,
                  bytes=b'',
-                 handle=None):
-        '''Set up a new parameter, only the name is required.'''
+                 handle=None,
+                 buffer=None):
+        '''Set up a new parameter, only the name is required.
+
+        If `buffer` is given, the binary representation of the parameter (as read by
+        `c3d.parameter.ParamData.read`) is stored and only parsed once one of the
+        parsed attributes is first accessed. Remaining attributes are then ignored.
+        '''
         self.name = name
         self.dtypes = dtype
+        if buffer is not None:
+            self._buffer = buffer
+            return
         self.desc = desc
         self.bytes_per_element = bytes_per_element
         self.dimensions = dimensions or []
@@ -46,6 +59,22 @@ class ParamData(object):
         if handle:
             self.read(handle)
 
+    def __getattr__(self, key):
+        # Only called for missing attributes, i.e. parsed attributes of a lazy parameter.
+        if key in ParamData._PARSED:
+            buffer = self.__dict__.get('_buffer')
+            if buffer is not None:
+                # Parse into a separate instance and assign the attributes before the buffer is
+                # removed, so threads reading the parameter meanwhile find one or the other.
+                parsed = ParamData(self.name, self.dtypes, handle=io.BytesIO(buffer))
+                for name in ParamData._PARSED:
+                    # Keep attributes assigned before the parameter was parsed.
+                    self.__dict__.setdefault(name, parsed.__dict__[name])
+                self.__dict__.pop('_buffer', None)
+            if key in self.__dict__:
+                return self.__dict__[key]
+        raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, key))
+
     def __repr__(self):
         return '<Param: {}>'.format(self.desc)
 
@@ -371,17 +400,14 @@ class ParamReadonly(object):
         elif len(self.dimensions) == 1:
             return np.array(self._data.bytes)
         else:
-            # Convert Fortran shape (data in memory is identical, shape is transposed)
+            # Convert Fortran shape (data in memory is identical, shape is transposed),
+            # words are stored consecutively in the order of the transposed shape.
             word_len = self.dimensions[0]
             dims = self.dimensions[1:][::-1]  # Identical to: [:0:-1]
-            byte_steps = np.cumprod(self.dimensions[:-1])[::-1]
-            # Generate mult-dimensional array and parse byte words
-            byte_arr = np.empty(dims, dtype=object)
-            for i in np.ndindex(*dims):
-                # Calculate byte offset as sum of each array index times the byte step of each dimension.
-                off = np.sum(np.multiply(i, byte_steps))
-                byte_arr[i] = self._data.bytes[off:off+word_len]
-            return byte_arr
+            data = self._data.bytes
+            byte_arr = np.empty(int(np.prod(dims)), dtype=object)
+            byte_arr[:] = [data[i * word_len:(i + 1) * word_len] for i in range(len(byte_arr))]
+            return byte_arr.reshape(dims)
 
     @property
     def string_array(self):
@@ -391,13 +417,20 @@ class ParamReadonly(object):
             return np.array([])
         elif len(self.dimensions) == 1:
             return np.array([self.string_value])
-        else:
-            # Parse byte sequences
-            byte_arr = self.bytes_array
-            # Decode sequences
-            for i in np.ndindex(byte_arr.shape):
-                byte_arr[i] = self.dtypes.decode_string(byte_arr[i])
-            return byte_arr
+        word_len = self.dimensions[0]
+        dims = self.dimensions[1:][::-1]
+        count = int(np.prod(dims))
+        data = self._data.bytes[:word_len * count]
+        if word_len > 0 and len(data) == word_len * count and data.isascii() and b'\0' not in data:
+            # Decode all words at once by viewing the bytes as an array of fixed size byte strings,
+            # ASCII strings decode identically using any of the decoders in `DataTypes.decode_string`.
+            words = np.frombuffer(data, dtype='S{}'.format(word_len))
+            return words.astype('U{}'.format(word_len)).astype(object).reshape(dims)
+        # Decode each of the byte sequences
+        byte_arr = self.bytes_array
+        for i in np.ndindex(byte_arr.shape):
+            byte_arr[i] = self.dtypes.decode_string(byte_arr[i])
+        return byte_arr
 
     @property
     def any_value(self):
@@ -1,13 +1,213 @@
 '''Contains the Reader class for reading C3D files.'''
 
+import contextlib
 import io
+import itertools
+import os
 import numpy as np
 import struct
 import warnings
-from .manager import Manager
+from concurrent.futures import ThreadPoolExecutor
+from .cache import BlockCache, Cache
+from .manager import AnalogTransform, Manager
 from .header import Header
 from .dtypes import DataTypes
-from .utils import DEC_to_IEEE_BYTES
+from .utils import DEC_to_IEEE, is_integer
+
+# Number of set bits for each value of the 7 bit camera-observation byte.
+_CAMERA_COUNT = np.array([bin(i).count('1') for i in range(128)], dtype=np.uint8)
+
+# Unique identifiers of reader instances, separating the entries of readers sharing a block cache.
+_READER_IDS = itertools.count()
+
+
+def _buffer_ring(buffers, shape, name):
+    '''Get an iterator cycling over caller-owned output buffers.
+
+    Parameters
+    ----------
+    buffers : numpy array, sequence of numpy arrays, or None
+        Output buffer(s), each buffer must be of the given shape.
+    shape : tuple of int
+        Expected shape of the buffers.
+    name : str
+        Argument name used in error messages.
+
+    Returns
+    -------
+    iterator : iterator over numpy arrays
+        Iterator cycling over the buffers, or repeating None if no buffers were given.
+    '''
+    if buffers is None:
+        return itertools.repeat(None)
+    if isinstance(buffers, np.ndarray):
+        buffers = [buffers]
+    for buf in buffers:
+        if buf.shape != tuple(shape):
+            raise ValueError('Expected {} to be of shape {}, was {}.'.format(name, tuple(shape), buf.shape))
+    return itertools.cycle(buffers)
+
+
+def _native_order(words):
+    '''Get an array of words in native byte order, swapping non-native (e.g. MIPS) words once.
+
+    Non-native words are copied into a native array, the words are column views of the
+    raw (read-only or memory mapped) frames and are never swapped in place.
+    '''
+    if words.dtype.isnative:
+        return words
+    return words.astype(words.dtype.newbyteorder())
+
+
+def _thread_pool(workers):
+    '''Get a thread pool context for a number of workers, or a null context if no more than one worker is used.'''
+    if workers is not None and workers > 1:
+        return ThreadPoolExecutor(workers)
+    return contextlib.nullcontext()
+
+
+class _DataFormat(object):
+    '''Encoding of the point and analog words in a data section.
+
+    Resolved once per decoded sequence of frames, rather than looking up the
+    parameters for each decoded frame.
+
+    Attributes
+    ----------
+    scale : float
+        Absolute value of POINT:SCALE, multiplied with integer point words.
+    is_float : bool
+        True if the words are floating point values (POINT:SCALE < 0).
+    is_dec : bool
+        True if the words are DEC floating point values, converted using `c3d.utils.DEC_to_IEEE`.
+    '''
+    __slots__ = ('scale', 'is_float', 'is_dec')
+
+    def __init__(self, reader):
+        point_scale = reader.point_scale
+        self.scale = abs(point_scale)
+        self.is_float = point_scale < 0
+        self.is_dec = self.is_float and reader._dtypes.is_dec
+
+
+class _StreamHandle(object):
+    '''Wrapper providing forward-only seeking for non-seekable streams, such as pipes.
+
+    Seeking forward discards bytes read from the stream. Bytes at positions before
+    `limit` are kept in memory, allowing the header and parameter sections to be
+    read more than once.
+    '''
+
+    def __init__(self, handle):
+        self._handle = handle
+        self._prefix = bytearray()
+        self._position = 0
+        self._stream_position = 0
+        self.limit = None
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation('Stream can only seek relative to the start or current position.')
+        if offset < self._stream_position and len(self._prefix) < self._stream_position:
+            raise io.UnsupportedOperation('Stream can not seek backwards to byte {}.'.format(offset))
+        self._position = offset
+        return offset
+
+    def close(self):
+        self._handle.close()
+
+    def read(self, size=-1):
+        data = b''
+        if self._position < self._stream_position:
+            # Read from bytes kept in memory
+            end = self._stream_position if size < 0 else min(self._position + size, self._stream_position)
+            data = bytes(self._prefix[self._position:end])
+            self._position = end
+            size = size if size < 0 else size - len(data)
+        if self._position > self._stream_position:
+            # Skip forward
+            self._read_stream(self._position - self._stream_position)
+            if self._position > self._stream_position:
+                return data
+        if size != 0:
+            data += self._read_stream(size)
+            self._position = self._stream_position
+        return data
+
+    def _read_stream(self, size):
+        '''Read up to size bytes from the stream (all remaining bytes if negative).'''
+        chunks = []
+        while size != 0:
+            chunk = self._handle.read(size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size = size - len(chunk) if size > 0 else size
+        data = b''.join(chunks)
+        if self.limit is None or self._stream_position < self.limit:
+            keep = len(data) if self.limit is None else self.limit - self._stream_position
+            self._prefix += data[:keep]
+        self._stream_position += len(data)
+        return data
+
+
+class DataLayout(object):
+    '''Layout of the data section of a C3D file, as computed by `Reader.verify_layout()`.
+
+    Attributes
+    ----------
+    data_start : int
+        Byte offset of the data section, given by the header.
+    frame_bytes : int
+        Number of bytes used to store each frame.
+    expected_frames : int
+        Number of frames in the file according to the metadata.
+    complete_frames : int
+        Number of complete frames stored in the file.
+    file_size : int
+        Size of the file in bytes.
+    trailing_bytes : int
+        Number of bytes following the expected end of the data section, negative
+        if the data section is truncated.
+    issues : list of str
+        Descriptions of the inconsistencies found, empty if the layout is valid.
+    '''
+
+    def __init__(self, data_start, frame_bytes, expected_frames, file_size):
+        self.data_start = data_start
+        self.frame_bytes = frame_bytes
+        self.expected_frames = expected_frames
+        self.file_size = file_size
+        self.trailing_bytes = file_size - data_start - expected_frames * frame_bytes
+        if frame_bytes > 0:
+            self.complete_frames = min(max(file_size - data_start, 0) // frame_bytes, expected_frames)
+        else:
+            self.complete_frames = expected_frames
+        self.issues = []
+
+    def __repr__(self):
+        return '<DataLayout: {} of {} frames complete, {} trailing bytes{}>'.format(
+            self.complete_frames, self.expected_frames, self.trailing_bytes, '' if self.ok else ', invalid')
+
+    @property
+    def ok(self) -> bool:
+        '''True if no inconsistencies were found.'''
+        return not self.issues
+
+    @property
+    def is_truncated(self) -> bool:
+        '''True if the file ends before the last frame is complete.'''
+        return self.complete_frames < self.expected_frames
+
+    @property
+    def is_padded(self) -> bool:
+        '''True if one or more blocks of 512 bytes follow the data section.'''
+        return self.trailing_bytes >= 512
 
 
 class Reader(Manager):
@@ -23,7 +223,7 @@ class Reader(Manager):
     ...     print('{0.shape} points in this frame'.format(points))
     '''
 
-    def __init__(self, handle):
+    def __init__(self, handle, mmap=False, lazy=False, stream=False, cache=None, block_cache=None):
         '''Initialize this C3D file by reading header and parameter data.
 
         Parameters
@@ -31,17 +231,45 @@ class Reader(Manager):
         handle : file handle
             Read metadata and C3D motion frames from the given file handle. This
             handle is assumed to be `seek`-able and `read`-able. The handle must
-            remain open for the life of the `Reader` instance. The `Reader` does
-            not `close` the handle.
+            remain open for the life of the `Reader` instance. The handle is only
+            closed by `Reader.close()`, or when exiting a `with` block using the reader.
+        mmap : bool, default=False
+            If True, the data section is accessed through a read-only `numpy.memmap`
+            rather than read from the handle, see `Reader.raw_frames()`. Requires the
+            handle to be a file object associated with a file descriptor.
+        lazy : bool, default=False
+            If True, the parameter section is only indexed when the file is opened,
+            and each parameter is parsed on first access. Speeds up opening files
+            when only a few parameters are of interest.
+        stream : bool, default=False
+            If True, the handle is only required to be `read`-able, such as a pipe or
+            socket. Sections of the file are read strictly in order, frames are read
+            in order and only once, and the check for data remaining after the data
+            section is skipped.
+        cache : `c3d.cache.Cache`, str or bool, optional
+            Cache, or directory of a cache, used to store the data decoded by `Reader.read_all()`,
+            repeated loads of the file are then served from the cache. If True, a cache in the
+            default directory is used. Only files on disk can be cached.
+        block_cache : `c3d.cache.BlockCache` or int, optional
+            In-memory cache, or the size in bytes of a cache, of decoded blocks of frames
+            used by `Reader.frame()` and indexing the reader. Frames in a block that was
+            recently visited are then returned without reading the file.
 
         Raises
         ------
         AssertionError
             If the metadata in the C3D file is inconsistent.
         '''
+        if stream:
+            if mmap:
+                raise ValueError('The data section of a stream can not be memory-mapped.')
+            handle = _StreamHandle(handle)
         super(Reader, self).__init__(Header(handle))
 
         self._handle = handle
+        self._stream = stream
+        self._mmap = mmap
+        self._memmap = None
 
         def seek_param_section_header():
             ''' Seek to and read the first 4 byte of the parameter header section '''
@@ -55,29 +283,37 @@ class Reader(Manager):
         self._dtypes = DataTypes(processor)
         # Convert header parameters in accordance with the processor type (MIPS format re-reads the header)
         self._header._processor_convert(self._dtypes, handle)
+        if stream:
+            # Only keep the sections preceding the data section in memory
+            handle.limit = (self._header.data_block - 1) * 512
 
-        # Restart reading the parameter header after parsing processor type
-        buf = seek_param_section_header()
+        # Restart reading the parameter header after parsing processor type,
+        # the remainder of the parameter section is read in a single call.
+        seek_param_section_header()
+        section = self._handle.read(512 * parameter_blocks - 4)
+        offset_fmt = ['<h', '>h'][self._dtypes.is_mips]
 
-        start_byte = self._handle.tell()
-        endbyte = start_byte + 512 * parameter_blocks - 4
-        while self._handle.tell() < endbyte:
-            chars_in_name, group_id = struct.unpack('bb', self._handle.read(2))
+        pos = 0
+        while pos < len(section):
+            chars_in_name, group_id = struct.unpack_from('bb', section, pos)
             if group_id == 0 or chars_in_name == 0:
                 # we've reached the end of the parameter section.
                 break
-            name = self._dtypes.decode_string(self._handle.read(abs(chars_in_name))).upper()
+            pos += 2
+            name = self._dtypes.decode_string(section[pos:pos + abs(chars_in_name)]).upper()
+            pos += abs(chars_in_name)
 
-            # Read the byte segment associated with the parameter and create a
-            # separate binary stream object from the data.
-            offset_to_next, = struct.unpack(['<h', '>h'][self._dtypes.is_mips], self._handle.read(2))
-            if offset_to_next == 0:
+            # Slice the byte segment associated with the parameter.
+            offset_to_next, = struct.unpack_from(offset_fmt, section, pos)
+            pos += 2
+            if offset_to_next <= 0:
                 # Last parameter, as number of bytes are unknown,
-                # read the remaining bytes in the parameter section.
-                bytes = self._handle.read(endbyte - self._handle.tell())
+                # use the remaining bytes in the parameter section.
+                end = len(section)
             else:
-                bytes = self._handle.read(offset_to_next - 2)
-            buf = io.BytesIO(bytes)
+                end = pos + offset_to_next - 2
+            bytes = section[pos:end]
+            pos = end
 
             if group_id > 0:
                 # We've just started reading a parameter. If its group doesn't
@@ -85,15 +321,18 @@ class Reader(Manager):
                 group = super(Reader, self).get(group_id)
                 if group is None:
                     group = self._add_group(group_id)
-                group.add_param(name, handle=buf)
+                if lazy:
+                    group.add_param(name, buffer=bytes)
+                else:
+                    group.add_param(name, handle=io.BytesIO(bytes))
             else:
                 # We've just started reading a group. If a group with the
                 # appropriate numerical id exists already (because we've
                 # already created it for a parameter), just set the name of
                 # the group. Otherwise, add a new group.
                 group_id = abs(group_id)
-                size, = struct.unpack('B', buf.read(1))
-                desc = size and buf.read(size) or ''
+                size, = struct.unpack_from('B', bytes)
+                desc = size and bytes[1:1 + size] or ''
                 group = super(Reader, self).get(group_id)
                 if group is not None:
                     self._rename_group(group, name)  # Inserts name key
@@ -103,7 +342,61 @@ class Reader(Manager):
 
         self._check_metadata()
 
-    def read_frames(self, copy=True, analog_transform=True, check_nan=True, camera_sum=False):
+        if block_cache is not None and not isinstance(block_cache, BlockCache):
+            block_cache = BlockCache(block_cache)
+        self._block_cache = block_cache
+        self._block_cache_id = next(_READER_IDS)
+
+        self._cache, self._cache_key = None, None
+        if cache is not None and cache is not False:
+            cache = cache if isinstance(cache, Cache) else Cache(None if cache is True else cache)
+            self._cache_key = None if stream else cache.file_key(handle, self._metadata_size())
+            if self._cache_key is None:
+                warnings.warn('cache is only supported for files on disk, data will not be cached.')
+            else:
+                self._cache = cache
+
+    @staticmethod
+    def open_mmap(path):
+        '''Open a C3D file with the data section mapped into memory.
+
+        Equivalent to `Reader(open(path, 'rb'), mmap=True)`, the opened file handle is
+        owned by the returned reader and closed by `Reader.close()`, use the reader as a
+        context manager to close the file when done:
+
+        >>> with c3d.Reader.open_mmap('capture.c3d') as r:
+        ...     points = r.point_coordinates()
+
+        Parameters
+        ----------
+        path : str
+            Path to the C3D file.
+
+        Returns
+        -------
+        reader : `c3d.reader.Reader`
+            Reader instance accessing the data section through a `numpy.memmap`.
+        '''
+        return Reader(open(path, 'rb'), mmap=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        '''Close the file handle of the reader.
+
+        The reference to the memory mapped data section is dropped, arrays previously
+        returned by `Reader.raw_frames()` remain valid until released.
+        '''
+        self._memmap = None
+        self._handle.close()
+
+    def read_frames(self, copy=True, analog_transform=True, check_nan=True, camera_sum=False,
+                    start=None, stop=None, step=1, points=None, analog=None, out_points=None, out_analog=None,
+                    camera_mask=False, points_dtype=np.float32, analog_dtype=float):
         '''Iterate over the data frames from our C3D file handle.
 
         Parameters
@@ -122,6 +415,40 @@ class Reader(Manager):
             and residuals will be set to -1.
         camera_sum : bool, default=False
             Camera flag bits will be summed, converting the fifth column to a camera visibility counter.
+        start : int, optional
+            Frame number of the first frame to read, defaults to `first_frame`.
+        stop : int, optional
+            Frame number to stop reading at (exclusive), defaults to `last_frame` + 1.
+        step : int, default=1
+            Increment between frame numbers read. The file handle is moved directly to each
+            requested frame, so only the selected frames are read and decoded.
+        points : iterable of str or int, optional
+            POINT:LABELS entries or indices of the points to decode. Only the selected
+            points are decoded and returned, in the given order. Defaults to all points.
+        analog : iterable of str or int, optional
+            ANALOG:LABELS entries or indices of the analog channels to decode, defaults
+            to all channels.
+        out_points : numpy array or sequence of numpy arrays, optional
+            Caller-owned array of shape (P, 5) the point data of each frame is decoded
+            into, P being the number of (selected) points. If a sequence of arrays is
+            given, the arrays are used in turn for consecutive frames (a ring of buffers).
+            The buffers are yielded as is, regardless of the `copy` argument.
+        out_analog : numpy array or sequence of numpy arrays, optional
+            Caller-owned array(s) of shape (C, S) the analog data is decoded into,
+            equivalent to `out_points`.
+        camera_mask : bool, default=False
+            If True, the camera-observation byte (or count, if `camera_sum` is True) is
+            returned as a separate uint8 array of shape (P,), appended to each yielded
+            tuple, and the point data only contain the first 4 columns.
+        points_dtype : numpy dtype or 'raw', default=numpy.float32
+            Floating point data type of the decoded point data. If 'raw', the point data of files
+            encoded using scaled integers are returned as int16 values without conversion,
+            the x, y, z coordinates and residual are then multiplied by `abs(point_scale)`
+            to get the scaled values. Invalid points have a residual of -1.
+        analog_dtype : numpy dtype, default=float
+            Data type of the decoded analog data, such as numpy.float32 to halve
+            the memory used by analog data compared to the default float64. Integer
+            types can only be used for integer words read without a transform.
 
         Returns
         -------
@@ -141,138 +468,869 @@ class Reader(Manager):
             Both the fourth and fifth values are -1 if the point is considered
             to be invalid.
         '''
-        # Point magnitude scalar, if scale parameter is < 0 data is floating point
-        # (in which case the magnitude is the absolute value)
-        scale_mag = abs(self.point_scale)
-        is_float = self.point_scale < 0
+        point_index = self._column_index(points, 'POINT')
+        analog_index = self._column_index(analog, 'ANALOG')
+        points_dtype, analog_dtype = self._output_dtypes(points_dtype, analog_dtype, analog_transform, analog_index)
 
-        if is_float:
-            point_word_bytes = 4
+        point_shape, analog_shape = self._output_shapes(point_index, analog_index, camera_mask=camera_mask)
+        point_buffers = _buffer_ring(out_points, point_shape, 'out_points')
+        analog_buffers = _buffer_ring(out_analog, analog_shape, 'out_analog')
+
+        points = np.zeros(point_shape, points_dtype)
+        analog = np.array([], analog_dtype)
+        cameras = np.zeros(point_shape[:-1], np.uint8) if camera_mask else None
+
+        transform = self._analog_transform(analog_transform, analog_index)
+        # Parameters describing the data are resolved once, rather than for each frame
+        fmt = _DataFormat(self)
+        has_analog = self.analog_used * self.analog_per_frame > 0
+        for frame_no, raw in self._iter_raw_frames(start, stop, step):
+            raw_points, raw_analog = self._select_columns(raw, point_index, analog_index)
+            out = next(point_buffers)
+            if camera_mask and copy:
+                cameras = np.empty(point_shape[:-1], np.uint8)
+            self._decode_points(raw_points, points if out is None else out, check_nan, camera_sum, cameras, fmt)
+            # Check if analog data exist, and parse if so
+            if has_analog:
+                analog = self._decode_analog(raw_analog, transform, next(analog_buffers), analog_dtype, fmt)
+
+            # Output buffers
+            if out is not None:
+                frame = frame_no, out, analog
+            elif copy:
+                frame = frame_no, points.copy(), analog  # .copy(), a new array is generated per frame for analog data.
+            else:
+                frame = frame_no, points, analog
+            yield frame + (cameras,) if camera_mask else frame
+
+    def frame(self, frame_no, analog_transform=True, check_nan=True, camera_sum=False, points=None, analog=None,
+              camera_mask=False, points_dtype=np.float32, analog_dtype=float):
+        '''Read and decode a single data frame.
+
+        Parameters
+        ----------
+        frame_no : int
+            Frame number of the frame to read, in the range [`first_frame`, `last_frame`].
+
+        See `read_frames()` for the remaining arguments.
+
+        Returns
+        -------
+        points, analog : numpy array
+            Point and analog data for the frame, formatted as in `read_frames()`.
+            If `camera_mask` is True, the camera array is returned as a third element.
+
+        Raises
+        ------
+        IndexError
+            If the frame number is outside the range of frames in the file, or the
+            frame could not be read.
+        '''
+        if not self.first_frame <= frame_no <= self.last_frame:
+            raise IndexError('Frame {} is outside the range of frames [{}, {}] in the file.'.format(
+                frame_no, self.first_frame, self.last_frame))
+        if self._block_cache is not None:
+            frames = self._read_cached(range(frame_no, frame_no + 1), analog_transform, check_nan, camera_sum,
+                                       points, analog, camera_mask, points_dtype, analog_dtype)
+            if len(frames[0]) == 0:
+                raise IndexError('Frame {} could not be read from the file.'.format(frame_no))
+            return tuple(f[0] for f in frames)
+        for frame in self.read_frames(False, analog_transform, check_nan, camera_sum,
+                                      start=frame_no, stop=frame_no + 1, points=points, analog=analog,
+                                      camera_mask=camera_mask, points_dtype=points_dtype, analog_dtype=analog_dtype):
+            return frame[1:]
+        raise IndexError('Frame {} could not be read from the file.'.format(frame_no))
+
+    def __getitem__(self, key):
+        '''Read and decode a frame, or a slice of frames, by frame number.
+
+        Frames are decoded as by `read_frames()` using the default arguments. If
+        the reader has a `block_cache`, frames are served from cached blocks.
+
+        >>> points, analog = reader[reader.first_frame]
+        >>> points, analog = reader[1000:2000:10]  # (100, P, 5) and (100, C, S) arrays
+
+        Parameters
+        ----------
+        key : int or slice
+            Frame number, or a slice of frame numbers in the range [`first_frame`, `last_frame`].
+
+        Returns
+        -------
+        points, analog : numpy array
+            Point and analog data for the frame, or the selected frames, see `frame()`
+            and `read_all()`.
+        '''
+        if isinstance(key, slice):
+            return self._read_cached(self._frame_range(key.start, key.stop, 1 if key.step is None else key.step))
+        if not is_integer(key):
+            raise TypeError('Expected frame number or slice, got {}.'.format(type(key).__name__))
+        return self.frame(int(key))
+
+    def _read_cached(self, frames, analog_transform=True, check_nan=True, camera_sum=False, points=None,
+                     analog=None, camera_mask=False, points_dtype=np.float32, analog_dtype=float):
+        '''Read a range of frames, using blocks of frames from the block cache if available.
+
+        Returns
+        -------
+        frames : tuple of numpy arrays
+            (points, analog[, cameras]) arrays for the frames, as returned by `read_all()`.
+        '''
+        point_index = self._column_index(points, 'POINT')
+        analog_index = self._column_index(analog, 'ANALOG')
+        points_dtype, analog_dtype = self._output_dtypes(points_dtype, analog_dtype, analog_transform, analog_index)
+
+        def decode(raw):
+            point_shape, analog_shape = self._output_shapes(point_index, analog_index, len(raw), camera_mask)
+            arrays = (np.zeros(point_shape, points_dtype), np.empty(analog_shape, analog_dtype))
+            if camera_mask:
+                arrays += (np.zeros(point_shape[:-1], np.uint8),)
+            self._decode_frames(raw, *arrays[:2], arrays[2] if camera_mask else None, point_index, analog_index,
+                                analog_transform, check_nan, camera_sum)
+            return arrays
+
+        if self._block_cache is None:
+            if frames.step == 1:
+                raw = [raw for _, raw in self._iter_raw_blocks(max(len(frames), 1), frames.start, frames.stop)]
+                return decode(raw[0] if raw else np.empty(0, self._frame_dtype()))
+            raw = [raw for _, raw in self._iter_raw_frames(frames.start, frames.stop, frames.step)]
+            return decode(np.array(raw, self._frame_dtype()))
+
+        frames_per_block = self._block_cache.frames_per_block
+        options = (self._block_cache_id, analog_transform, check_nan, camera_sum, camera_mask,
+                   points_dtype, analog_dtype,
+                   None if point_index is None else tuple(point_index),
+                   None if analog_index is None else tuple(analog_index))
+        # Select the rows of each block containing the frames
+        indices = np.asarray(frames, int) - self.first_frame
+        parts = []
+        for block in np.unique(indices // frames_per_block):
+            arrays = self._block_cache.get((block,) + options)
+            if arrays is None:
+                start = self.first_frame + block * frames_per_block
+                raw = [raw for _, raw in self._iter_raw_blocks(frames_per_block, start, start + frames_per_block)]
+                if not raw:
+                    break
+                arrays = decode(raw[0])
+                self._block_cache.put((block,) + options, arrays)
+            rows = indices[indices // frames_per_block == block] - block * frames_per_block
+            parts.append([a[rows[rows < len(a)]] for a in arrays])
+            if len(arrays[0]) < frames_per_block:
+                # Last block, or the file is truncated
+                break
+        if not parts:
+            return decode(np.empty(0, self._frame_dtype()))
+        return tuple(np.concatenate(arrays) for arrays in zip(*parts))
+
+    def read_all(self, analog_transform=True, check_nan=True, camera_sum=False, points=None, analog=None,
+                 out_points=None, out_analog=None, camera_mask=False, workers=1, points_dtype=np.float32,
+                 analog_dtype=float):
+        '''Read and decode every data frame in the file using a single pass.
+
+        The data section is read with one call to the file handle and decoded with
+        whole-array operations, which is considerably faster than iterating over
+        `read_frames()` for large files. Arguments are equivalent to `read_frames()`,
+        except that `out_points` and `out_analog` must be single arrays of shape
+        (N, P, 5) and (N, C, S) respectively.
+
+        If `workers` is larger than 1, disjoint frame ranges are decoded into the
+        result arrays on a pool of `workers` threads.
+
+        If the reader was opened with a `cache`, the arrays are loaded from the cache
+        when the file was previously decoded using the same arguments. Arrays loaded from
+        the cache are memory-mapped copy-on-write, modifying them doesn't change the cache.
+
+        Returns
+        -------
+        points : (N, P, 5) numpy array
+            Point data for all N frames, each frame formatted as the point data
+            returned from `read_frames()`.
+        analog : (N, C, S) numpy array
+            Analog data for all N frames, where C is the number of analog channels
+            and S the number of analog samples per frame.
+        cameras : (N, P) numpy array
+            Camera-observation bytes, only returned if `camera_mask` is True.
+
+        Example
+        -------
+        >>> r = c3d.Reader(open('capture.c3d', 'rb'))
+        >>> points, analog = r.read_all()
+        >>> print('{0.shape} points, {1.shape} analog samples'.format(points, analog))
+        '''
+        point_index = self._column_index(points, 'POINT')
+        analog_index = self._column_index(analog, 'ANALOG')
+        points_dtype, analog_dtype = self._output_dtypes(points_dtype, analog_dtype, analog_transform, analog_index)
+        options = None
+        if self._cache is not None:
+            options = dict(points=point_index, analog=analog_index, analog_transform=analog_transform,
+                           check_nan=check_nan, camera_sum=camera_sum, camera_mask=camera_mask,
+                           points_dtype=points_dtype, analog_dtype=analog_dtype)
+            cached = self._cache.load(self._cache_key, options)
+            if cached is not None:
+                return self._cached_frames(cached, out_points, out_analog)
+        raw = self.raw_frames()
+
+        point_shape, analog_shape = self._output_shapes(point_index, analog_index, len(raw), camera_mask)
+        out_points = next(_buffer_ring(out_points, point_shape, 'out_points'))
+        out_analog = next(_buffer_ring(out_analog, analog_shape, 'out_analog'))
+
+        points = np.zeros(point_shape, points_dtype) if out_points is None else out_points
+        analog = np.empty(analog_shape, analog_dtype) if out_analog is None else out_analog
+        cameras = np.zeros(point_shape[:-1], np.uint8) if camera_mask else None
+        with _thread_pool(workers) as pool:
+            self._decode_frames(raw, points, analog, cameras, point_index, analog_index,
+                                analog_transform, check_nan, camera_sum, pool, workers)
+        frames = (points, analog, cameras) if camera_mask else (points, analog)
+        if options is not None:
+            self._handle.seek(0)
+            self._cache.store(self._cache_key, options, frames, self._handle.read(self._metadata_size()))
+        return frames
+
+    def _cached_frames(self, cached, out_points=None, out_analog=None):
+        '''Get arrays loaded from the cache, copied to the output arrays if given, see `read_all()`.'''
+        frames = list(cached)
+        for i, (buffers, name) in enumerate(((out_points, 'out_points'), (out_analog, 'out_analog'))):
+            out = next(_buffer_ring(buffers, frames[i].shape, name))
+            if out is not None:
+                out[...] = frames[i]
+                frames[i] = out
+        return tuple(frames)
+
+    def read_blocks(self, frames_per_block=4096, analog_transform=True, check_nan=True, camera_sum=False,
+                    start=None, stop=None, points=None, analog=None, out_points=None, out_analog=None,
+                    camera_mask=False, workers=1, points_dtype=np.float32, analog_dtype=float):
+        '''Iterate over blocks of consecutive data frames.
+
+        Each block is read with a single call to the file handle and decoded with
+        whole-array operations, providing the performance of `read_all()` while
+        limiting memory use to the size of a block.
+
+        Parameters
+        ----------
+        frames_per_block : int, default=4096
+            Maximum number of frames in each block, the last block may contain fewer frames.
+        out_points : numpy array or sequence of numpy arrays, optional
+            Caller-owned array(s) of shape (frames_per_block, P, 5) blocks are decoded into.
+            If a sequence of arrays is given, the arrays are used in turn for consecutive
+            blocks, allowing a consumer to process one block while the next is decoded.
+            Yielded blocks are views of the buffers (truncated for the last block).
+        out_analog : numpy array or sequence of numpy arrays, optional
+            Caller-owned array(s) of shape (frames_per_block, C, S) equivalent to `out_points`.
+        workers : int, default=1
+            Number of threads used to decode each block, see `read_all()`.
+
+        See `read_frames()` for the remaining arguments.
+
+        Returns
+        -------
+        blocks : sequence of (frame numbers, points, analog)
+            This method generates a sequence of (frame numbers, points, analog) tuples,
+            one tuple per block. The first element is an array of N frame numbers, the
+            second a (N, P, 5) array of point data and the third a (N, C, S) array of
+            analog data, with frames formatted as in `read_frames()`. If `camera_mask` is
+            True, a (N, P) array of camera-observation bytes is appended to each tuple.
+
+        Example
+        -------
+        >>> r = c3d.Reader(open('capture.c3d', 'rb'))
+        >>> for frame_nos, points, analog in r.read_blocks(1000):
+        ...     print('frames {} to {}'.format(frame_nos[0], frame_nos[-1]))
+        '''
+        if frames_per_block < 1:
+            raise ValueError('Expected frames per block to be a positive integer, was {}.'.format(frames_per_block))
+        point_index = self._column_index(points, 'POINT')
+        analog_index = self._column_index(analog, 'ANALOG')
+        points_dtype, analog_dtype = self._output_dtypes(points_dtype, analog_dtype, analog_transform, analog_index)
+
+        point_shape, analog_shape = self._output_shapes(point_index, analog_index, frames_per_block, camera_mask)
+        point_buffers = _buffer_ring(out_points, point_shape, 'out_points')
+        analog_buffers = _buffer_ring(out_analog, analog_shape, 'out_analog')
+
+        with _thread_pool(workers) as pool:
+            for frame_nos, raw in self._iter_raw_blocks(frames_per_block, start, stop):
+                count = len(frame_nos)
+                points, analog = next(point_buffers), next(analog_buffers)
+                points = np.zeros((count,) + point_shape[1:], points_dtype) if points is None else points[:count]
+                analog = np.empty((count,) + analog_shape[1:], analog_dtype) if analog is None else analog[:count]
+                cameras = np.zeros(points.shape[:-1], np.uint8) if camera_mask else None
+
+                self._decode_frames(raw, points, analog, cameras, point_index, analog_index,
+                                    analog_transform, check_nan, camera_sum, pool, workers)
+                if camera_mask:
+                    yield frame_nos, points, analog, cameras
+                else:
+                    yield frame_nos, points, analog
+
+    def raw_frames(self):
+        '''Get the data section as a structured array of encoded frames.
+
+        Each entry in the array is a frame with the field `points`, of shape
+        (POINT:USED, 4), and the field `analog`, of shape (analog_per_frame, ANALOG:USED),
+        containing the words as encoded in the file. If the reader was opened in `mmap`
+        mode the array is a `numpy.memmap` and no data is read until accessed, otherwise
+        the data section is read into memory. Only complete frames are included.
+
+        Example
+        -------
+        >>> r = c3d.Reader.open_mmap('capture.c3d')
+        >>> xyz = r.raw_frames()['points'][1000:2000, :, :3]  # No copy for IEEE float files
+
+        Returns
+        -------
+        frames : (N,) numpy array
+            Structured array with the data type `Reader._frame_dtype()`.
+        '''
+        if self._memmap is not None:
+            return self._memmap
+
+        frame_dtype = self._frame_dtype()
+        frame_count = self.frame_count
+        frame_bytes = frame_dtype.itemsize
+        data_start = (self._header.data_block - 1) * 512
+
+        if self._mmap:
+            data_bytes = os.fstat(self._handle.fileno()).st_size - data_start
+        else:
+            self._handle.seek(data_start)
+            raw_bytes = self._handle.read(frame_count * frame_bytes)
+            data_bytes = len(raw_bytes)
+
+        if frame_bytes > 0 and data_bytes < frame_count * frame_bytes:
+            # Only provide complete frames
+            frame_count = data_bytes // frame_bytes
+            warnings.warn('''reached end of file (EOF) while reading data at frame index {}
+                             and file pointer {}!'''.format(frame_count, data_start + frame_count * frame_bytes))
+        elif self._mmap:
+            if data_bytes - frame_count * frame_bytes >= 512:
+                warnings.warn('incomplete reading of data blocks. {} bytes remained after all datablocks were read!'
+                              .format(data_bytes - frame_count * frame_bytes))
+        else:
+            self._check_eof()
+
+        if not self._mmap:
+            return np.frombuffer(raw_bytes, dtype=frame_dtype, count=frame_count)
+        if frame_bytes * frame_count == 0:
+            # Empty data sections can't be mapped
+            self._memmap = np.zeros(frame_count, dtype=frame_dtype)
         else:
-            point_word_bytes = 2
-        points = np.zeros((self.point_used, 5), np.float32)
+            self._memmap = np.memmap(self._handle, dtype=frame_dtype, mode='r',
+                                     offset=data_start, shape=(frame_count,))
+        return self._memmap
+
+    def point_coordinates(self, frames=slice(None)):
+        '''Get the x, y, z point coordinates for a set of frames.
+
+        Coordinates are not masked, use `Reader.point_residuals()` to determine
+        which samples are valid. For IEEE floating point files (INTEL or MIPS) the
+        coordinates are returned as a view into `Reader.raw_frames()`, which means
+        no data is copied if the reader was opened in `mmap` mode.
+
+        Parameters
+        ----------
+        frames : slice, int, or array of int
+            Index of the frames to get coordinates for, indices are relative to the
+            first frame in the file.
+
+        Returns
+        -------
+        coordinates : (..., P, 3) numpy array
+            Coordinates for the P points in each selected frame.
+        '''
+        coordinates = self._decode_coordinates(self.raw_frames()['points'][frames])
+        if self.point_scale >= 0:
+            # Integer coordinates are scaled in double precision
+            return coordinates.astype(np.float32)
+        return coordinates
+
+    def point_residuals(self, frames=slice(None), check_nan=True):
+        '''Get the scaled point residuals for a set of frames.
+
+        Parameters
+        ----------
+        frames : slice, int, or array of int
+            Index of the frames to decode, see `Reader.point_coordinates()`.
+        check_nan : bool, default=True
+            See `read_frames()`.
+
+        Returns
+        -------
+        residuals : (..., P) numpy array
+            Residual estimates for the P points in each selected frame, -1 for invalid samples.
+        '''
+        raw = self.raw_frames()['points'][frames]
+        last_word = self._decode_point_word(raw)
+        residuals = ((last_word & 0x00ff) * abs(self.point_scale)).astype(np.float32)
+        invalid = last_word < 0
+        if check_nan and self.point_scale < 0:
+            invalid |= ~np.all(np.isfinite(self._decode_coordinates(raw)), axis=-1)
+        residuals[invalid] = -1
+        return residuals
+
+    def point_cameras(self, frames=slice(None), camera_sum=False):
+        '''Get the camera-observation bits of points for a set of frames.
+
+        Parameters
+        ----------
+        frames : slice, int, or array of int
+            Index of the frames to decode, see `Reader.point_coordinates()`.
+        camera_sum : bool, default=False
+            See `read_frames()`.
+
+        Returns
+        -------
+        cameras : (..., P) numpy array
+            Camera flag bits (or the number of cameras if `camera_sum` is True) for the P
+            points in each selected frame.
+        '''
+        camera_byte = (self._decode_point_word(self.raw_frames()['points'][frames]) & 0x7f00) >> 8
+        if camera_sum:
+            return _CAMERA_COUNT[camera_byte]
+        return camera_byte.astype(np.uint8)
+
+    def verify_layout(self):
+        '''Verify that the size of the file matches the data section described by the metadata.
+
+        The expected size of the data section is computed from the header, the
+        POINT:DATA_START parameter, the frame range and the number of bytes per
+        frame, and compared with the size of the file. No frame data is read, so the
+        check takes constant time regardless of the size of the file.
+
+        Returns
+        -------
+        layout : `c3d.reader.DataLayout`
+            Layout of the data section, describing any inconsistencies found.
+
+        Raises
+        ------
+        io.UnsupportedOperation
+            If the reader was opened in `stream` mode, as the size of a stream is unknown.
+
+        Example
+        -------
+        >>> layout = c3d.Reader(open('capture.c3d', 'rb')).verify_layout()
+        >>> if not layout.ok:
+        ...     print(layout.issues)
+        '''
+        if self._stream:
+            raise io.UnsupportedOperation('The layout of a stream can not be verified.')
+        try:
+            file_size = os.fstat(self._handle.fileno()).st_size
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            position = self._handle.tell()
+            file_size = self._handle.seek(0, io.SEEK_END)
+            self._handle.seek(position)
+
+        layout = DataLayout(self._metadata_size(), self._frame_dtype().itemsize, self.frame_count, file_size)
+        param = self.get('POINT:DATA_START')
+        if param is None:
+            layout.issues.append('missing parameter POINT:DATA_START')
+        elif param.uint16_value != self._header.data_block:
+            layout.issues.append('inconsistent data block, {} in header != {} in POINT:DATA_START'.format(
+                self._header.data_block, param.uint16_value))
+        if self._header.data_block <= self._header.parameter_block:
+            layout.issues.append('data block {} does not follow parameter block {}'.format(
+                self._header.data_block, self._header.parameter_block))
+        if layout.expected_frames < 0:
+            layout.issues.append('last frame {} precedes first frame {}'.format(self.last_frame, self.first_frame))
+        if layout.is_truncated:
+            layout.issues.append('data section truncated, {} of {} frames complete ({} bytes missing)'.format(
+                layout.complete_frames, layout.expected_frames, -layout.trailing_bytes))
+        elif layout.is_padded:
+            layout.issues.append('{} bytes remain after the data section ({} frames of {} bytes)'.format(
+                layout.trailing_bytes, layout.trailing_bytes // layout.frame_bytes if layout.frame_bytes else 0,
+                layout.frame_bytes))
+        return layout
+
+    def _metadata_size(self):
+        '''Number of bytes preceding the data section, i.e. the size of the header and parameter section.'''
+        return (self._header.data_block - 1) * 512
+
+    def _frame_range(self, start=None, stop=None, step=1):
+        '''Get the range of frame numbers selected by the (start, stop, step) arguments.'''
+        if step < 1:
+            raise ValueError('Expected frame step to be a positive integer, was {}.'.format(step))
+        first_frame, end_frame = self.first_frame, self.last_frame + 1
+        start = first_frame if start is None else min(max(start, first_frame), end_frame)
+        stop = end_frame if stop is None else min(max(stop, start), end_frame)
+        return range(start, stop, step)
+
+    def _iter_raw_frames(self, start=None, stop=None, step=1):
+        '''Iterate over (frame number, raw frame) pairs in the data section.
+
+        See `read_frames()` for arguments.
+        '''
+        frames = self._frame_range(start, stop, step)
+        if self._mmap:
+            raw = self.raw_frames()
+            for frame_no in frames:
+                index = frame_no - self.first_frame
+                if index >= len(raw):
+                    return
+                yield frame_no, raw[index]
+            return
+
+        frame_dtype = self._frame_dtype()
+        frame_bytes = frame_dtype.itemsize
+        data_start = (self._header.data_block - 1) * 512
+
+        # Parse the data blocks
+        for frame_no in frames:
+            if frame_no == frames.start or step > 1:
+                # Seek to the start point of the frame, frames are stored in fixed size records
+                self._handle.seek(data_start + (frame_no - self.first_frame) * frame_bytes)
+            # Read the byte data (used) for the frame
+            raw_bytes = self._handle.read(frame_bytes)
+            # Verify read pointer
+            if len(raw_bytes) < frame_bytes:
+                warnings.warn('''reached end of file (EOF) while reading POINT data at frame index {}
+                                 and file pointer {}!'''.format(frame_no - self.first_frame, self._handle.tell()))
+                return
+            yield frame_no, np.frombuffer(raw_bytes, dtype=frame_dtype, count=1)[0]
+
+        if len(frames) > 0 and frames[-1] == self.last_frame:
+            self._check_eof()
+
+    def _iter_raw_blocks(self, frames_per_block, start=None, stop=None):
+        '''Iterate over (frame numbers, raw frames) pairs for blocks of consecutive frames.
+
+        See `read_blocks()` for arguments.
+        '''
+        frames = self._frame_range(start, stop)
+        if self._mmap:
+            raw = self.raw_frames()
+            frames = frames[:max(len(raw) - (frames.start - self.first_frame), 0)]
+            for i in range(0, len(frames), frames_per_block):
+                frame_nos = np.arange(frames.start + i, frames.start + min(i + frames_per_block, len(frames)))
+                yield frame_nos, raw[frame_nos - self.first_frame]
+            return
+
+        frame_dtype = self._frame_dtype()
+        frame_bytes = frame_dtype.itemsize
+
+        # Seek to the start point of the first frame
+        self._handle.seek((self._header.data_block - 1) * 512 + (frames.start - self.first_frame) * frame_bytes)
+        for i in range(0, len(frames), frames_per_block):
+            count = min(frames_per_block, len(frames) - i)
+            raw_bytes = self._handle.read(count * frame_bytes)
+            if len(raw_bytes) < count * frame_bytes:
+                # Only provide complete frames
+                count = len(raw_bytes) // frame_bytes
+                warnings.warn('''reached end of file (EOF) while reading data at frame index {}
+                                 and file pointer {}!'''.format(frames.start + i + count - self.first_frame,
+                                                               self._handle.tell()))
+                if count > 0:
+                    yield (np.arange(frames.start + i, frames.start + i + count),
+                           np.frombuffer(raw_bytes, dtype=frame_dtype, count=count))
+                return
+            yield (np.arange(frames.start + i, frames.start + i + count),
+                   np.frombuffer(raw_bytes, dtype=frame_dtype, count=count))
+
+        if len(frames) > 0 and frames[-1] == self.last_frame:
+            self._check_eof()
+
+    def _column_index(self, selection, group):
+        '''Resolve a selection of labels or indices to an array of column indices.
+
+        Parameters
+        ----------
+        selection : iterable of str or int, or None
+            Labels or indices of the columns to select.
+        group : str
+            Group name, 'POINT' or 'ANALOG', the columns belong to.
+
+        Returns
+        -------
+        index : numpy array of int or None
+            Column indices, None if no selection was made.
+
+        Raises
+        ------
+        KeyError
+            If a label does not match an entry in the LABELS parameter of the group.
+        IndexError
+            If an index is out of range.
+        '''
+        if selection is None:
+            return None
+        if isinstance(selection, (str, int, np.integer)):
+            selection = [selection]
+        count = self.point_used if group == 'POINT' else self.analog_used
+        index = np.empty(len(selection), dtype=np.intp)
+        for i, key in enumerate(selection):
+            if isinstance(key, str):
+                index[i] = self._label_index(group, key)
+            else:
+                if not -count <= key < count:
+                    raise IndexError('{} index {} is out of range for {} columns.'.format(group, key, count))
+                index[i] = key % count
+        return index
+
+    def _output_shapes(self, point_index=None, analog_index=None, frame_count=None, camera_mask=False):
+        '''Get the shapes of decoded (points, analog) arrays for a frame, or a block of frames.'''
+        point_shape = (self.point_used if point_index is None else len(point_index), 4 if camera_mask else 5)
+        analog_shape = (self.analog_used if analog_index is None else len(analog_index), self.analog_per_frame)
+        if frame_count is None:
+            return point_shape, analog_shape
+        return (frame_count,) + point_shape, (frame_count,) + analog_shape
+
+    def _output_dtypes(self, points_dtype=np.float32, analog_dtype=float, analog_transform=True, analog_index=None):
+        '''Get the data types of decoded (points, analog) arrays, see `read_frames()`.
+
+        Raises
+        ------
+        ValueError
+            If decoding into the data types would truncate the data, i.e. for integer point
+            data types other than 'raw', or integer analog data types if the analog data are
+            transformed or encoded as floating point.
+        '''
+        if isinstance(points_dtype, str) and points_dtype == 'raw':
+            if self.point_scale < 0:
+                raise ValueError("Point data can only be read as 'raw' from files encoded using scaled integers.")
+            points_dtype = np.int16
+        elif np.dtype(points_dtype).kind in 'iu':
+            raise ValueError("Expected a floating point data type for point data, use 'raw' to read the integer "
+                             "words of files encoded using scaled integers, was {}.".format(np.dtype(points_dtype)))
+        analog_dtype = np.dtype(analog_dtype)
+        if analog_dtype.kind in 'iu':
+            if self.point_scale < 0:
+                raise ValueError('Analog data of files encoded using floating point can not be read as {}.'.format(
+                    analog_dtype))
+            if self._analog_transform(analog_transform, analog_index) is not None:
+                raise ValueError('Transformed analog data can not be read as {}, '
+                                 'use analog_transform=False to read the integer words.'.format(analog_dtype))
+        return np.dtype(points_dtype), analog_dtype
+
+    def _select_columns(self, raw, point_index=None, analog_index=None):
+        '''Select the raw (points, analog) words for a set of columns from raw frame data.'''
+        raw_points, raw_analog = raw['points'], raw['analog']
+        if point_index is not None:
+            raw_points = raw_points[..., point_index, :]
+        if analog_index is not None:
+            raw_analog = raw_analog[..., analog_index]
+        return raw_points, raw_analog
+
+    def _data_dtypes(self):
+        '''Get the data types used to encode POINT and ANALOG words in the data section.
+
+        Returns
+        -------
+        point_dtype, analog_dtype : numpy.dtype
+            Data types matching the words as stored in the file. DEC floating point
+            words are returned as 32 bit unsigned integers as they require conversion.
+        '''
+        # If scale parameter is < 0 data is floating point
+        is_float = self.point_scale < 0
 
         # TODO: handle ANALOG:BITS parameter here!
         p = self.get('ANALOG:FORMAT')
         analog_unsigned = p and p.string_value.strip().upper() == 'UNSIGNED'
         if is_float:
-            analog_dtype = self._dtypes.float32
-            analog_word_bytes = 4
+            if self._dtypes.is_dec:
+                return np.dtype(self._dtypes.uint32), np.dtype(self._dtypes.uint32)
+            return np.dtype(self._dtypes.float32), np.dtype(self._dtypes.float32)
         elif analog_unsigned:
             # Note*: Floating point is 'always' defined for both analog and point data, according to the standard.
-            analog_dtype = self._dtypes.uint16
-            analog_word_bytes = 2
+            analog_dtype = np.dtype(self._dtypes.uint16)
             # Verify BITS parameter for analog
             p = self.get('ANALOG:BITS')
-            if p and p._as_integer_value / 8 != analog_word_bytes:
+            if p and p._as_integer_value / 8 != analog_dtype.itemsize:
                 raise NotImplementedError('Analog data using {} bits is not supported.'.format(p._as_integer_value))
         else:
-            analog_dtype = self._dtypes.int16
-            analog_word_bytes = 2
+            analog_dtype = np.dtype(self._dtypes.int16)
+        return np.dtype(self._dtypes.int16), analog_dtype
 
-        analog = np.array([], float)
-        analog_scales, analog_offsets = self.get_analog_transform()
+    def _frame_dtype(self):
+        '''Get a structured data type describing the binary layout of a single data frame.
 
-        # Seek to the start point of the data blocks
-        self._handle.seek((self._header.data_block - 1) * 512)
-        # Number of values (words) read in regard to POINT/ANALOG data
-        N_point = 4 * self.point_used
-        N_analog = self.analog_used * self.analog_per_frame
+        The 'points' field is of shape (POINT:USED, 4) and the 'analog' field of
+        shape (analog_per_frame, ANALOG:USED), i.e. analog channels are interleaved.
+        '''
+        point_dtype, analog_dtype = self._data_dtypes()
+        return np.dtype([('points', point_dtype, (self.point_used, 4)),
+                         ('analog', analog_dtype, (self.analog_per_frame, self.analog_used))])
 
-        # Total bytes per frame
-        point_bytes = N_point * point_word_bytes
-        analog_bytes = N_analog * analog_word_bytes
-        # Parse the data blocks
-        for frame_no in range(self.first_frame, self.last_frame + 1):
-            # Read the byte data (used) for the block
-            raw_bytes = self._handle.read(N_point * point_word_bytes)
-            raw_analog = self._handle.read(N_analog * analog_word_bytes)
-            # Verify read pointers (any of the two can be assumed to be 0)
-            if len(raw_bytes) < point_bytes:
-                warnings.warn('''reached end of file (EOF) while reading POINT data at frame index {}
-                                 and file pointer {}!'''.format(frame_no - self.first_frame, self._handle.tell()))
-                return
-            if len(raw_analog) < analog_bytes:
-                warnings.warn('''reached end of file (EOF) while reading POINT data at frame index {}
-                                 and file pointer {}!'''.format(frame_no - self.first_frame, self._handle.tell()))
-                return
+    def _decode_frames(self, raw, points, analog, cameras, point_index, analog_index,
+                       analog_transform=True, check_nan=True, camera_sum=False, pool=None, workers=1):
+        '''Decode a block of raw frames into preallocated output arrays.
 
-            if is_float:
-                # Convert every 4 byte words to a float-32 reprensentation
-                # (the fourth column is still not a float32 representation)
-                if self._dtypes.is_dec:
-                    # Convert each of the first 6 16-bit words from DEC to IEEE float
-                    points[:, :4] = DEC_to_IEEE_BYTES(raw_bytes).reshape((self.point_used, 4))
-                else:  # If IEEE or MIPS:
-                    # Convert each of the first 6 16-bit words to native float
-                    points[:, :4] = np.frombuffer(raw_bytes,
-                                                  dtype=self._dtypes.float32,
-                                                  count=N_point).reshape((self.point_used, 4))
-
-                # Cast last word to signed integer in system endian format
-                last_word = points[:, 3].astype(np.int32)
+        Parameters
+        ----------
+        raw : (N,) numpy array
+            Raw frames with the data type `Reader._frame_dtype()`.
+        points, analog, cameras : numpy array
+            Output arrays for the N frames, `cameras` may be None.
+        point_index, analog_index : numpy array of int or None
+            Selected columns, see `Reader._column_index()`.
+        pool : concurrent.futures.Executor, optional
+            If given, the frames are split into `workers` disjoint ranges decoded by the pool.
+        '''
+        raw_points, raw_analog = self._select_columns(raw, point_index, analog_index)
+        transform = self._analog_transform(analog_transform, analog_index)
+        fmt = _DataFormat(self)
 
-            else:
-                # View the bytes as signed 16-bit integers
-                raw = np.frombuffer(raw_bytes,
-                                    dtype=self._dtypes.int16,
-                                    count=N_point).reshape((self.point_used, 4))
-                # Read the first six 16-bit words as x, y, z coordinates
-                points[:, :3] = raw[:, :3] * scale_mag
-                # Cast last word to signed integer in system endian format
-                last_word = raw[:, 3].astype(np.int16)
-
-            # Parse camera-observed bits and residuals.
-            # Notes:
-            # - Invalid sample if residual is equal to -1 (check if word < 0).
-            # - A residual of 0.0 represent modeled data (filtered or interpolated).
-            # - Camera and residual words are always 8-bit (1 byte), never 16-bit.
-            # - If floating point, the byte words are encoded in an integer cast to a float,
-            #    and are written directly in byte form (see the MLS guide).
-            ##
-            # Read the residual and camera byte words (Note* if 32 bit word negative sign is discarded).
-            residual_byte, camera_byte = (last_word & 0x00ff), (last_word & 0x7f00) >> 8
-
-            # Fourth value is floating-point (scaled) error estimate (residual)
-            points[:, 3] = residual_byte * scale_mag
-
-            # Determine invalid samples
-            invalid = last_word < 0
-            if check_nan:
-                is_nan = ~np.all(np.isfinite(points[:, :4]), axis=1)
-                points[is_nan, :3] = 0.0
-                invalid |= is_nan
-            # Update discarded - sign
-            points[invalid, 3] = -1
-
-            # Fifth value is the camera-observation byte
-            if camera_sum:
-                # Convert to observation sum
-                points[:, 4] = sum((camera_byte & (1 << k)) >> k for k in range(7))
-            else:
-                points[:, 4] = camera_byte  # .astype(np.float32)
+        def decode(frames):
+            # Big-endian (MIPS) words are swapped once for the range, rather than by each operation reading them
+            self._decode_points(_native_order(raw_points[frames]), points[frames], check_nan, camera_sum,
+                                None if cameras is None else cameras[frames], fmt)
+            self._decode_analog(_native_order(raw_analog[frames]), transform, analog[frames], fmt=fmt)
 
-            # Check if analog data exist, and parse if so
-            if N_analog > 0:
-                if is_float and self._dtypes.is_dec:
-                    # Convert each of the 16-bit words from DEC to IEEE float
-                    analog = DEC_to_IEEE_BYTES(raw_analog)
-                else:
-                    # Integer or INTEL/MIPS floating point data can be parsed directly
-                    analog = np.frombuffer(raw_analog, dtype=analog_dtype, count=N_analog)
+        if pool is None or len(raw) < 2:
+            decode(slice(None))
+            return
+        size = -(-len(raw) // workers)
+        # Consume the results to propagate exceptions raised by the workers
+        for _ in pool.map(decode, [slice(i, i + size) for i in range(0, len(raw), size)]):
+            pass
 
-                # Reformat and convert
-                analog = analog.reshape((-1, self.analog_used)).T
-                analog = analog.astype(float)
-                # Convert analog
-                analog = (analog - analog_offsets) * analog_scales
+    def _decode_points(self, raw, out, check_nan=True, camera_sum=False, cameras=None, fmt=None):
+        '''Decode raw point words into the 5 column point format.
 
-            # Output buffers
-            if copy:
-                yield frame_no, points.copy(), analog  # .copy(), a new array is generated per frame for analog data.
-            else:
-                yield frame_no, points, analog
+        Parameters
+        ----------
+        raw : (..., P, 4) numpy array
+            Point words as viewed through the `points` field of `Reader._frame_dtype()`.
+        out : (..., P, 5) numpy array
+            Output array the decoded point data is written to. If the array is of an
+            integer type, the coordinates and residuals are written without being scaled.
+        check_nan, camera_sum : bool
+            See `read_frames()`.
+        cameras : (..., P) numpy array, optional
+            If given, camera-observation values are written to this array rather
+            than the fifth column of `out`, which then only need 4 columns.
+        fmt : `_DataFormat`, optional
+            Encoding of the words, resolved from the reader if not given.
+        '''
+        fmt = fmt or _DataFormat(self)
+        # Point magnitude scalar, if scale parameter is < 0 data is floating point
+        # (in which case the magnitude is the absolute value)
+        scale_mag = fmt.scale
+        if out.dtype.kind in 'iu':
+            # Raw integer output, scaling is left to the caller
+            scale_mag = 1
+            check_nan = False
+            out[..., :3] = raw[..., :3]
+        else:
+            self._decode_coordinates(raw, out[..., :3], fmt)
+        last_word = self._decode_point_word(raw, fmt)
+
+        # Parse camera-observed bits and residuals.
+        # Notes:
+        # - Invalid sample if residual is equal to -1 (check if word < 0).
+        # - A residual of 0.0 represent modeled data (filtered or interpolated).
+        # - Camera and residual words are always 8-bit (1 byte), never 16-bit.
+        # - If floating point, the byte words are encoded in an integer cast to a float,
+        #    and are written directly in byte form (see the MLS guide).
+        ##
+        # Read the residual and camera byte words (Note* if 32 bit word negative sign is discarded).
+        residual_byte, camera_byte = (last_word & 0x00ff), (last_word & 0x7f00) >> 8
+
+        # Fourth value is floating-point (scaled) error estimate (residual)
+        out[..., 3] = residual_byte * scale_mag
+
+        # Determine invalid samples
+        invalid = last_word < 0
+        if check_nan:
+            is_nan = ~np.isfinite(out[..., :3]).all(axis=-1)
+            out[is_nan, :3] = 0.0
+            invalid |= is_nan
+        # Update discarded - sign
+        out[invalid, 3] = -1
+
+        # Fifth value is the camera-observation byte
+        if camera_sum:
+            # Convert to observation sum
+            camera_byte = _CAMERA_COUNT[camera_byte]
+        if cameras is None:
+            out[..., 4] = camera_byte
+        else:
+            cameras[...] = camera_byte
+        return out
+
+    def _decode_coordinates(self, raw, out=None, fmt=None):
+        '''Decode the x, y, z coordinates from raw point words of shape (..., P, 4).
+
+        If no output array is given, IEEE floating point coordinates are returned as a view of `raw`.
+        '''
+        fmt = fmt or _DataFormat(self)
+        if fmt.is_float:
+            if fmt.is_dec:
+                # Convert each of the first 3 32-bit words from DEC to IEEE float
+                if out is None or out.dtype == np.float32:
+                    return DEC_to_IEEE(raw[..., :3], out)
+                out[...] = DEC_to_IEEE(raw[..., :3])
+                return out
+            # If IEEE or MIPS, the words are floating point values
+            if out is None:
+                return raw[..., :3]
+            out[...] = raw[..., :3]
+            return out
+        # Read the first six 16-bit words as x, y, z coordinates
+        return np.multiply(raw[..., :3], fmt.scale, out=out)
+
+    def _decode_point_word(self, raw, fmt=None):
+        '''Get the residual and camera word from raw point words as signed integers.'''
+        fmt = fmt or _DataFormat(self)
+        if fmt.is_float:
+            # If floating point, the byte words are encoded in an integer cast to a float
+            # (the fourth column is still not a float32 representation)
+            word = raw[..., 3]
+            if fmt.is_dec:
+                word = DEC_to_IEEE(word)
+            # Cast last word to signed integer in system endian format
+            return word.astype(np.int32)
+        # Cast last word to signed integer in system endian format
+        return raw[..., 3].astype(np.int16)
+
+    def _analog_transform(self, analog_transform=True, channels=None):
+        '''Get the `c3d.manager.AnalogTransform` for a set of analog channels, or None if not transformed.'''
+        if not analog_transform:
+            return None
+        transform = AnalogTransform.from_manager(self).select(channels)
+        return None if transform.is_identity else transform
+
+    def _decode_analog(self, raw, transform=None, out=None, dtype=float, fmt=None):
+        '''Decode raw analog words.
+
+        Parameters
+        ----------
+        raw : (..., S, C) numpy array
+            Analog words as viewed through the `analog` field of `Reader._frame_dtype()`.
+        transform : `c3d.manager.AnalogTransform`, optional
+            Transform applied to the (selected) channels in `raw`, see `Reader._analog_transform()`.
+        out : (..., C, S) numpy array, optional
+            Output array the decoded analog data is written to.
+        dtype : numpy dtype, default=float
+            Data type of the returned array, if no output array is given.
+        fmt : `_DataFormat`, optional
+            Encoding of the words, resolved from the reader if not given.
+
+        Returns
+        -------
+        analog : (..., C, S) numpy array
+            Decoded analog data for C channels and S samples.
+        '''
+        fmt = fmt or _DataFormat(self)
+        if fmt.is_dec:
+            # Convert each of the 16-bit words from DEC to IEEE float
+            analog = DEC_to_IEEE(raw)
+        else:
+            # Integer or INTEL/MIPS floating point data can be parsed directly
+            analog = raw
+
+        # Reformat, the transform is applied while copying the transposed words to the output
+        analog = analog.swapaxes(-1, -2)
+        if out is None:
+            out = np.empty(analog.shape, dtype)
+        if transform is None:
+            out[...] = analog
+            return out
+        return transform.apply(analog, out)
 
+    def _check_eof(self):
+        '''Warn if data blocks remain after the end of the data section has been read.'''
+        if self._stream:
+            # Remaining bytes in a stream can't be determined without reading them
+            return
         # Function evaluating EOF, note that data section is written in blocks of 512
         final_byte_index = self._handle.tell()
         self._handle.seek(0, 2)  # os.SEEK_END)
@@ -0,0 +1,133 @@
+'''Contains the StreamWriter class for writing C3D files incrementally.'''
+
+import numpy as np
+from .writer import _FrameEncoder, _MetadataWriter
+
+
+class StreamWriter(_MetadataWriter):
+    '''This class writes frames to a C3D file as they are appended.
+
+    The header and parameter section are written when the first frame is appended,
+    followed by the encoded frames, so memory use doesn't depend on the number of
+    frames written. Space is reserved after the parameter section and when the
+    writer is closed the header and parameter section are rewritten in place,
+    updating POINT:FRAMES, POINT:LONG_FRAMES, TRIAL:ACTUAL_END_FIELD and
+    header.last_frame. Metadata is edited through the same methods as for a
+    `c3d.writer.Writer`, parameters used to encode frames (such as POINT:SCALE
+    and the analog scales) must be set before the first frame is appended.
+
+    >>> with open('capture.c3d', 'wb') as handle, c3d.StreamWriter(handle, point_rate=200) as writer:
+    ...     writer.set_point_labels(labels)
+    ...     writer.set_analog_labels(None)
+    ...     for points, analog in capture():
+    ...         writer.append(points, analog)
+    '''
+
+    def __init__(self,
+                 handle,
+                 point_rate=480.,
+                 analog_rate=0.,
+                 point_scale=-1.,
+                 reserved_blocks=1):
+        '''Set minimal metadata for this writer.
+
+        Parameters
+        ----------
+        handle : file
+            Seekable file handle positioned at the start of the file, the writer
+            does not close the handle.
+        point_rate, analog_rate, point_scale : float, optional
+            See `c3d.writer.Writer`.
+        reserved_blocks : int, default=1
+            Number of 512 byte blocks reserved for the parameter section to grow after
+            the first frame is appended, such as when POINT:LONG_FRAMES is added.
+        '''
+        super(StreamWriter, self).__init__(point_rate, analog_rate, point_scale)
+        self._handle = handle
+        self._reserved_blocks = reserved_blocks
+        self._encoder = None
+        self._shapes = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Complete the frames written before an error, but don't mask the error if nothing was written
+        if exc_type is None or self._encoder is not None:
+            self.close()
+
+    def append(self, points, analog=()):
+        '''Append a single frame.
+
+        Parameters
+        ----------
+        points : (P, 5) array
+            Point data of the frame, formatted as the point data returned from
+            `c3d.reader.Reader.read_frames()`.
+        analog : (C, S) array, optional
+            Analog data of the frame, may be empty if the file has no analog data.
+        '''
+        self.append_block(np.asarray(points)[np.newaxis], np.asarray(analog)[np.newaxis])
+
+    def append_block(self, points, analog):
+        '''Append a block of consecutive frames.
+
+        Parameters
+        ----------
+        points : (N, P, 5) array
+            Point data for N frames, see `c3d.writer.Writer.set_data()`.
+        analog : (N, C, S) array
+            Analog data for N frames, see `c3d.writer.Writer.set_data()`.
+        '''
+        if self._closed:
+            raise ValueError('Attempted to append frames to a closed StreamWriter.')
+        points, analog = self._check_data(points, analog)
+        shapes = points.shape[1:], analog.shape[1:]
+        if self._encoder is None:
+            self._begin(*shapes)
+        elif shapes != self._shapes:
+            raise ValueError('Shape of appended data does not match previous frames. '
+                             'Expected shapes {} and {}, was {} and {}.'.format(*self._shapes, *shapes))
+
+        step = self._encoder.frames_per_block
+        for i in range(0, len(points), step):
+            self._handle.write(self._encoder.encode(points[i:i + step], analog[i:i + step]))
+        self._frame_count += len(points)
+
+    def close(self):
+        '''Complete the file by rewriting the header and parameter section with the number of frames written.
+
+        Raises
+        ------
+        RuntimeError
+            If no frames were appended or if the parameter section no longer fits the
+            blocks preceding the data section.
+        '''
+        if self._closed:
+            return
+        if self._encoder is None:
+            raise RuntimeError('Attempted to write empty file.')
+        self._closed = True
+        self._pad_block(self._handle)
+        end = self._handle.tell()
+
+        data_block = int(self._header.data_block)
+        self._set_frame_metadata(self._shapes[0][0], self._shapes[1], self._frame_count)
+        if self.parameter_blocks() > data_block - 2:
+            raise RuntimeError(
+                'Parameter section of {} blocks does not fit the {} blocks preceding the data section, '
+                'increase reserved_blocks.'.format(self.parameter_blocks(), data_block - 2))
+        self._set_data_start(data_block)
+
+        self._handle.seek(0)
+        self._write_metadata(self._handle)
+        self._handle.seek(end)
+
+    def _begin(self, point_shape, analog_shape):
+        '''Write the header and parameter section, followed by the reserved blocks.'''
+        self._shapes = point_shape, analog_shape
+        self._set_frame_metadata(point_shape[0], analog_shape, 0)
+        self._set_data_start(self.parameter_blocks() + 2 + self._reserved_blocks)
+        self._write_metadata(self._handle)
+        self._encoder = _FrameEncoder(self, point_shape[0], analog_shape)
@@ -77,13 +77,15 @@ def UNPACK_FLOAT_MIPS(uint_32):
     return struct.unpack('f', struct.pack(">I", uint_32))[0]
 
 
-def DEC_to_IEEE(uint_32):
-    '''Convert the 32 bit representation of a DEC float to IEEE format.
+def DEC_to_IEEE(uint_32, out=None):
+    '''Convert the 32 bit representation of DEC floats to IEEE format.
 
     Params:
     ----
-    uint_32 : 32 bit unsigned integer containing the DEC single precision float point bits.
+    uint_32 : 32 bit unsigned integer, or array of integers, containing the DEC single precision float point bits.
+    out : Optional float32 array of the same shape as the input the converted values are written to.
     Returns : IEEE formated floating point of the same shape as the input.
+    Raises : ValueError if the output array isn't a float32 array, as the bits are written directly.
     '''
     # Follows the bit pattern found:
     # 	http://home.fnal.gov/~yang/Notes/ieee_vs_dec_float.txt
@@ -93,8 +95,6 @@ def DEC_to_IEEE(uint_32):
     # in a big endian 16 bit word representation, and needs to be inverted.
     # Second reference describe the DEC->IEEE conversion.
 
-    # Warning! Unsure if NaN numbers are managed appropriately.
-
     # Shuffle the first two bit words from DEC bit representation to an ordered representation.
     # Note that the most significant fraction bits are placed in the first 7 bits.
     #
@@ -110,45 +110,52 @@ def DEC_to_IEEE(uint_32):
     # _______________________________________________________
     # |Bit adress -     ..       - Bit adress | Bit adress - ..
     ####
-
-    # Swap the first and last 16  bits for a consistent alignment of the fraction
-    reshuffled = ((uint_32 & 0xFFFF0000) >> 16) | ((uint_32 & 0x0000FFFF) << 16)
-    # After the shuffle each part are in little-endian and ordered as: SIGN-Exponent-Fraction
-    exp_bits = ((reshuffled & 0xFF000000) - 1) & 0xFF000000
-    reshuffled = (reshuffled & 0x00FFFFFF) | exp_bits
-    return UNPACK_FLOAT_IEEE(reshuffled)
-
-
-def DEC_to_IEEE_BYTES(bytes):
+    words = np.asarray(uint_32, dtype=np.uint32)
+    if out is not None and out.dtype != np.float32:
+        raise ValueError('Expected output array of type float32, was {}.'.format(out.dtype))
+    result = np.empty(words.shape, dtype=np.float32) if out is None else out
+
+    # Operate on pairs of 16 bit words (little-endian system assumed)
+    words16 = words[..., None].view(np.uint16)
+    result16 = result[..., None].view(np.uint16)
+
+    # Swap the first and last 16 bits for a consistent alignment of the fraction,
+    # after the shuffle each part are in little-endian and ordered as: SIGN-Exponent-Fraction.
+    # DEC floats are of the form 0.1f * 2^(exp - 128), while IEEE floats are 1.f * 2^(exp - 127),
+    # and the exponent (bits 14-7 of the first word) is decremented by 2 while swapping.
+    result16[..., 0] = words16[..., 1]
+    np.subtract(words16[..., 0], np.uint16(2 << 7), out=result16[..., 1])
+
+    # Exponents < 3 can't be decremented without adjusting the fraction
+    special = (words16[..., 0] & np.uint16(0x7f80)) <= np.uint16(2 << 7)
+    if special.any():
+        result[special] = _DEC_to_IEEE_small_exponent(words[special])
+
+    if out is None and result.ndim == 0:
+        return float(result)
+    return result
+
+
+def _DEC_to_IEEE_small_exponent(words):
+    '''Convert a 1D array of DEC floats with exponents < 3 to IEEE format.'''
+    bits = (words >> np.uint32(16)) | (words << np.uint32(16))
+    exponent = bits & np.uint32(0x7f800000)
+    # Exponent 1 or 2: Values are subnormal in IEEE format, divide the IEEE float with the same
+    # bit pattern by four to round the fraction.
+    result = bits.view(np.float32) * np.float32(0.25)
+    # Exponent 0: Zero if the sign bit is clear, otherwise a reserved operand (converted to NaN)
+    zero = exponent == 0
+    result[zero] = np.where(bits[zero] & np.uint32(0x80000000), np.float32(np.nan), np.float32(0))
+    return result
+
+
+def DEC_to_IEEE_BYTES(bytes, out=None):
     '''Convert byte array containing 32 bit DEC floats to IEEE format.
 
     Params:
     ----
     bytes : Byte array where every 4 bytes represent a single precision DEC float.
+    out : Optional float32 array the converted values are written to, see `DEC_to_IEEE`.
     Returns : IEEE formated floating point of the same shape as the input.
     '''
-
-    # See comments in DEC_to_IEEE() for DEC format definition
-
-    # Reshuffle
-    bytes = memoryview(bytes)
-    reshuffled = np.empty(len(bytes), dtype=np.dtype('B'))
-    reshuffled[::4] = bytes[2::4]
-    reshuffled[1::4] = bytes[3::4]
-    reshuffled[2::4] = bytes[::4]
-    # Decrement exponent by 2, if exp. > 1
-    reshuffled[3::4] = bytes[1::4] + (np.bitwise_and(bytes[1::4], 0x7f) == 0) - 1
-
-    # There are different ways to adjust for differences in DEC/IEEE representation
-    # after reshuffle. Two simple methods are:
-    # 1) Decrement exponent bits by 2, then convert to IEEE.
-    # 2) Convert to IEEE directly and divide by four.
-    # 3) Handle edge cases, expensive in python...
-    # However these are simple methods, and do not accurately convert when:
-    # 1) Exponent < 2 (without bias), impossible to decrement exponent without adjusting fraction/mantissa.
-    # 2) Exponent == 0, DEC numbers are then 0 or undefined while IEEE is not. NaN are produced when exponent == 255.
-    # Here method 1) is used, which mean that only small numbers will be represented incorrectly.
-
-    return np.frombuffer(reshuffled.tobytes(),
-                         dtype=np.float32,
-                         count=int(len(bytes) / 4))
+    return DEC_to_IEEE(np.frombuffer(bytes, dtype='<u4', count=len(bytes) // 4), out)
@@ -5,146 +5,117 @@ import numpy as np
 import struct
 # import warnings
 from . import utils
-from .manager import Manager
+from .manager import AnalogTransform, Manager
 from .dtypes import DataTypes
 
 
-class Writer(Manager):
-    '''This class writes metadata and frames to a C3D file.
+# Size in bytes of the blocks of frames encoded and written at a time.
+_BLOCK_BYTES = 2**22
 
-    For example, to read an existing C3D file, apply some sort of data
-    processing to the frames, and write out another C3D file::
 
-    >>> r = c3d.Reader(open('data.c3d', 'rb'))
-    >>> w = c3d.Writer()
-    >>> w.add_frames(process_frames_somehow(r.read_frames()))
-    >>> with open('smoothed.c3d', 'wb') as handle:
-    >>>     w.write(handle)
+class _FrameEncoder(object):
+    '''Encodes blocks of point and analog frames into the records of a C3D data section.
 
-    Parameters
-    ----------
-    point_rate : float, optional
-        The frame rate of the data. Defaults to 480.
-    analog_rate : float, optional
-        The number of analog samples per frame. Defaults to 0.
-    point_scale : float, optional
-        The scale factor for point data. Defaults to -1 (i.e., "check the
-        POINT:SCALE parameter").
-    point_units : str, optional
-        The units that the point numbers represent. Defaults to ``'mm  '``.
-    gen_scale : float, optional
-        General scaling factor for analog data. Defaults to 1.
+    Frames are encoded with whole-array operations into a reusable buffer, producing
+    the same bytes as encoding the frames one at a time. The coordinates of invalid
+    points (negative residual) repeat the last encoded coordinates of the point, so
+    the encoder keeps state between consecutive blocks.
     '''
 
-    def __init__(self,
-                 point_rate=480.,
-                 analog_rate=0.,
-                 point_scale=-1.):
-        '''Set minimal metadata for this writer.
+    def __init__(self, manager, point_count, analog_shape):
+        '''Initialize the encoder for frames of a file described by the metadata of a manager.
 
+        Parameters
+        ----------
+        manager : `c3d.manager.Manager`
+            Metadata providing POINT:SCALE and the analog transform parameters.
+        point_count : int
+            Number of points P in each frame.
+        analog_shape : (int, int)
+            Shape (C, S) of the analog data in each frame.
         '''
-        self._dtypes = DataTypes()  # Only support INTEL format from writing
-        super(Writer, self).__init__()
-
-        # Header properties
-        self._header.frame_rate = np.float32(point_rate)
-        self._header.scale_factor = np.float32(point_scale)
-        self.analog_rate = analog_rate
-        self._frames = []
-
-    @staticmethod
-    def from_reader(reader, conversion=None):
-        ''' Convert a `c3d.reader.Reader` to a persistent `c3d.writer.Writer` instance.
+        self.scale_mag = abs(manager.point_scale)
+        if manager.point_scale < 0:
+            point_dtype = manager._dtypes.float32
+            self.point_scale = 1.0
+        else:
+            point_dtype = manager._dtypes.int16
+            self.point_scale = self.scale_mag
+        self.transform = AnalogTransform.from_manager(manager)
+        channels, samples = analog_shape
+        dtype = np.dtype([('points', point_dtype, (point_count, 4)), ('analog', point_dtype, (samples, channels))])
+        self.frames_per_block = max(1, _BLOCK_BYTES // max(dtype.itemsize, 1))
+        self._records = np.empty(self.frames_per_block, dtype)
+        self._coordinates = np.zeros((point_count, 3), point_dtype)
+
+    def encode(self, points, analog):
+        '''Encode a block of at most `frames_per_block` frames.
 
         Parameters
         ----------
-        source : `c3d.reader.Reader`
-            Source to copy data from.
-        conversion : str
-            Conversion mode, None is equivalent to the default mode. Supported modes are:
-
-                'convert'       - (Default) Convert the Reader to a Writer
-                                  instance and explicitly delete the Reader.
-
-                'copy'          - Reader objects will be deep copied.
-
-                'copy_metadata' - Similar to 'copy' but only copies metadata and
-                                  not point and analog frame data.
-
-                'copy_shallow'  - Similar to 'copy' but group parameters are
-                                  not copied.
-
-                'copy_header'   - Similar to 'copy_shallow' but only the
-                                  header is copied (frame data is not copied).
+        points : (N, P, 5) numpy array
+            Point data of the frames.
+        analog : (N, C, S) numpy array
+            Analog data of the frames.
 
         Returns
         -------
-        param : `c3d.writer.Writer`
-            A writeable and persistent representation of the `c3d.reader.Reader` object.
-
-        Raises
-        ------
-        ValueError
-            If mode string is not equivalent to one of the supported modes.
-            If attempting to convert non-Intel files using mode other than 'shallow_copy'.
+        data : memoryview
+            Encoded bytes, only valid until the next block is encoded.
         '''
-        writer = Writer()
-        # Modes
-        is_header_only = conversion == 'copy_header'
-        is_meta_copy = conversion == 'copy_metadata'
-        is_meta_only = is_header_only or is_meta_copy
-        is_consume = conversion == 'convert' or conversion is None
-        is_shallow_copy = conversion == 'shallow_copy' or is_header_only
-        is_deep_copy = conversion == 'copy' or is_meta_copy
-        # Verify mode
-        if not (is_consume or is_shallow_copy or is_deep_copy):
-            raise ValueError(
-                "Unknown mode argument %s. Supported modes are: 'consume', 'copy', or 'shallow_copy'".format(
-                    conversion
-                ))
-        if not reader._dtypes.is_ieee and not is_shallow_copy:
-            # Can't copy/consume non-Intel files due to the uncertainty of converting parameter data.
-            raise ValueError(
-                "File was read in %s format and only 'shallow_copy' mode is supported for non Intel files!".format(
-                    reader._dtypes.proc_type
-                ))
-
-        if is_consume:
-            writer._header = reader._header
-            writer._groups = reader._groups
-        elif is_deep_copy:
-            writer._header = copy.deepcopy(reader._header)
-            writer._groups = copy.deepcopy(reader._groups)
-        elif is_shallow_copy:
-            # Only copy header (no groups)
-            writer._header = copy.deepcopy(reader._header)
-            # Reformat header events
-            writer._header.encode_events(writer._header.events)
+        count = len(points)
+        records = self._records[:count]
+        raw = records['points']
+        valid = points[:, :, 3] >= 0.0
+        invalid = np.nonzero(~valid)
+
+        # Encode every entry, then overwrite entries of invalid points (values may be NaN)
+        coordinates = raw[:, :, :3]
+        with np.errstate(invalid='ignore'):
+            coordinates[...] = points[:, :, :3] / self.point_scale
+            raw[:, :, 3] = np.bitwise_or(np.rint(points[:, :, 3] / self.scale_mag).astype(np.uint8),
+                                         points[:, :, 4].astype(np.uint16) << 8,
+                                         dtype=np.uint16)
+        raw[:, :, 3][invalid] = -1
+        if len(invalid[0]) > 0:
+            # Index of the last frame each point was valid in, -1 if not valid in the block yet
+            last = np.where(valid, np.arange(count)[:, np.newaxis], -1)
+            np.maximum.accumulate(last, axis=0, out=last)
+            last = last[invalid]
+            seen = last >= 0
+            coordinates[invalid[0][seen], invalid[1][seen]] = coordinates[last[seen], invalid[1][seen]]
+            coordinates[invalid[0][~seen], invalid[1][~seen]] = self._coordinates[invalid[1][~seen]]
+        if count > 0:
+            self._coordinates = coordinates[-1].copy()
+
+        records['analog'] = self.transform.invert(analog).transpose(0, 2, 1)
+        return memoryview(records.view(np.uint8))
+
+
+class _MetadataWriter(Manager):
+    '''Base class for writers, providing methods editing the metadata of a C3D file and writing it to a handle.
+
+    Subclasses determine how data frames are added and how the data section is written, see
+    `c3d.writer.Writer` and `c3d.stream_writer.StreamWriter`.
+    '''
 
-            # Transfer a minimal set parameters
-            writer.set_start_frame(reader.first_frame)
-            writer.set_point_labels(reader.point_labels)
-            writer.set_analog_labels(reader.analog_labels)
+    def __init__(self, point_rate=480., analog_rate=0., point_scale=-1.):
+        '''Set minimal metadata for this writer.
 
-            gen_scale, analog_scales, analog_offsets = reader.get_analog_transform_parameters()
-            writer.set_analog_general_scale(gen_scale)
-            writer.set_analog_scales(analog_scales)
-            writer.set_analog_offsets(analog_offsets)
+        '''
+        self._dtypes = DataTypes()  # Only support INTEL format from writing
+        super(_MetadataWriter, self).__init__()
 
-        if not is_meta_only:
-            # Copy frames
-            for (i, point, analog) in reader.read_frames(copy=True, camera_sum=False):
-                writer.add_frames((point, analog))
-        if is_consume:
-            # Cleanup
-            reader._header = None
-            reader._groups = None
-            del reader
-        return writer
+        # Header properties
+        self._header.frame_rate = np.float32(point_rate)
+        self._header.scale_factor = np.float32(point_scale)
+        self.analog_rate = analog_rate
+        # Number of frames added to the writer
+        self._frame_count = 0
 
     @property
     def analog_rate(self):
-        return super(Writer, self).analog_rate
+        return super(_MetadataWriter, self).analog_rate
 
     @analog_rate.setter
     def analog_rate(self, value):
@@ -200,59 +171,34 @@ class Writer(Manager):
         group : `c3d.group.Group`
             An editable group instance.
         '''
-        return super(Writer, self)._add_group(group_id, name, desc)
+        return super(_MetadataWriter, self)._add_group(group_id, name, desc)
 
     def rename_group(self, *args):
         ''' Rename a specified parameter group (see Manager._rename_group for args). '''
-        super(Writer, self)._rename_group(*args)
+        super(_MetadataWriter, self)._rename_group(*args)
 
     def remove_group(self, *args):
         '''Remove the parameter group. (see Manager._rename_group for args). '''
-        super(Writer, self)._remove_group(*args)
-
-    def add_frames(self, frames, index=None):
-        '''Add frames to this writer instance.
-
-        Parameters
-        ----------
-        frames : Single or sequence of (point, analog) pairs
-            A sequence or frame of frame data to add to the writer.
-        index : int or None
-            Insert the frame or sequence at the index (the first sequence frame will be inserted at the given `index`).
-            Note that the index should be relative to 0 rather then the frame number provided by read_frames()!
-        '''
-        sh = np.shape(frames)
-        # Single frame
-        if len(sh) < 2:
-            frames = [frames]
-            sh = np.shape(frames)
-
-        # Check data shapes match
-        if len(self._frames) > 0:
-            point0, analog0 = self._frames[0]
-            psh, ash = np.shape(point0), np.shape(analog0)
-            for f in frames:
-                if np.shape(f[0]) != psh:
-                    raise ValueError(
-                        'Shape of analog data does not previous frames. Expexted shape {}, was {}.'.format(
-                            str(psh), str(np.shape(f[0]))
-                        ))
-                if np.shape(f[1]) != ash:
-                    raise ValueError(
-                        'Shape of analog data does not previous frames. Expexted shape {}, was {}.'.format(
-                            str(ash), str(np.shape(f[1]))
-                        ))
-
-        # Sequence of invalid shape
-        if sh[1] != 2:
-            raise ValueError(
-                'Expected frame input to be sequence of point and analog pairs on form (None, 2). ' +
-                'Input was of shape {}.'.format(str(sh)))
+        super(_MetadataWriter, self)._remove_group(*args)
 
-        if index is not None:
-            self._frames[index:index] = frames
-        else:
-            self._frames.extend(frames)
+    @staticmethod
+    def _check_data(points, analog):
+        '''Convert point and analog data to contiguous arrays, verifying the shapes.'''
+        points = np.ascontiguousarray(points)
+        analog = np.ascontiguousarray(analog)
+        # Frames without point or analog data, such as ``(points, ())``
+        if points.ndim == 2 and points.size == 0:
+            points = points.reshape((len(points), 0, 5))
+        if analog.ndim == 2 and analog.size == 0:
+            analog = analog.reshape((len(analog), 0, 0))
+        if points.ndim != 3 or points.shape[2] != 5:
+            raise ValueError('Expected point data of shape (N, P, 5), was {}.'.format(str(points.shape)))
+        if analog.ndim != 3:
+            raise ValueError('Expected analog data of shape (N, C, S), was {}.'.format(str(analog.shape)))
+        if len(points) != len(analog):
+            raise ValueError('Expected point and analog data for the same number of frames, was {} and {}.'.format(
+                len(points), len(analog)))
+        return points, analog
 
     def set_point_labels(self, labels):
         ''' Set point data labels.
@@ -361,26 +307,23 @@ class Writer(Manager):
         group.set_str('X_SCREEN', 'X_SCREEN parameter', X)
         group.set_str('Y_SCREEN', 'Y_SCREEN parameter', Y)
 
-    def write(self, handle):
-        '''Write metadata, point and analog frames to a file handle.
+    def _set_frame_metadata(self, ppf, analog_shape, nframes):
+        '''Set the parameters and header entries describing the data section.
 
         Parameters
         ----------
-        handle : file
-            Write metadata and C3D motion frames to the given file handle. The
-            writer does not close the handle.
+        ppf : int
+            Number of points in each frame.
+        analog_shape : (int, int)
+            Shape (C, S) of the analog data in each frame.
+        nframes : int
+            Number of frames in the data section.
         '''
-        if not self._frames:
-            raise RuntimeError('Attempted to write empty file.')
-
-        points, analog = self._frames[0]
-        ppf = len(points)
-        apf = len(analog)
+        apf = analog_shape[0]
 
         first_frame = self.first_frame
         if first_frame <= 0:  # Bad value
             first_frame = 1
-        nframes = len(self._frames)
         last_frame = first_frame + nframes - 1
 
         UINT16_MAX = 65535
@@ -423,14 +366,13 @@ class Writer(Manager):
         self._set_last_frame(last_frame)
 
         # sync parameter information to header.
-        start_block = self.parameter_blocks() + 2
-        self.get('POINT:DATA_START').bytes = struct.pack('<H', start_block)
-        self._header.data_block = np.uint16(start_block)
         self._header.point_count = np.uint16(ppf)
-        self._header.analog_count = np.uint16(np.prod(np.shape(analog)))
+        self._header.analog_count = np.uint16(np.prod(analog_shape))
 
-        self._write_metadata(handle)
-        self._write_frames(handle)
+    def _set_data_start(self, start_block):
+        '''Set the POINT:DATA_START parameter and header.data_block entry to the first block of the data section.'''
+        self.get('POINT:DATA_START').bytes = struct.pack('<H', start_block)
+        self._header.data_block = np.uint16(start_block)
 
     def _pad_block(self, handle):
         '''Pad the file with 0s to the end of the next block boundary.'''
@@ -465,6 +407,375 @@ class Writer(Manager):
         while handle.tell() != 512 * (self.header.data_block - 1):
             handle.write(b'\x00' * 512)
 
+
+class Writer(_MetadataWriter):
+    '''This class writes metadata and frames to a C3D file.
+
+    For example, to read an existing C3D file, apply some sort of data
+    processing to the frames, and write out another C3D file::
+
+    >>> r = c3d.Reader(open('data.c3d', 'rb'))
+    >>> w = c3d.Writer()
+    >>> w.add_frames(process_frames_somehow(r.read_frames()))
+    >>> with open('smoothed.c3d', 'wb') as handle:
+    >>>     w.write(handle)
+
+    Parameters
+    ----------
+    point_rate : float, optional
+        The frame rate of the data. Defaults to 480.
+    analog_rate : float, optional
+        The number of analog samples per frame. Defaults to 0.
+    point_scale : float, optional
+        The scale factor for point data. Defaults to -1 (i.e., "check the
+        POINT:SCALE parameter").
+    point_units : str, optional
+        The units that the point numbers represent. Defaults to ``'mm  '``.
+    gen_scale : float, optional
+        General scaling factor for analog data. Defaults to 1.
+    '''
+
+    def __init__(self,
+                 point_rate=480.,
+                 analog_rate=0.,
+                 point_scale=-1.):
+        '''Set minimal metadata for this writer.
+
+        '''
+        super(Writer, self).__init__(point_rate, analog_rate, point_scale)
+
+        # Frame data, stored in arrays with capacity for at least `_frame_count` frames
+        self._points = None
+        self._analog = None
+        # Reader the data section is copied from, see `Writer.from_reader()`
+        self._source = None
+        self._source_encoding = None
+
+    @staticmethod
+    def from_arrays(points, analog, point_rate=480., analog_rate=None, point_scale=-1.):
+        '''Create a writer from arrays of point and analog data.
+
+        Parameters
+        ----------
+        points : (N, P, 5) array
+            Point data for N frames, each frame formatted as the point data returned
+            from `c3d.reader.Reader.read_frames()`.
+        analog : (N, C, S) array
+            Analog data for N frames, where C is the number of analog channels and S
+            the number of analog samples per frame.
+        point_rate : float, optional
+            The frame rate of the data. Defaults to 480.
+        analog_rate : float, optional
+            The analog sample rate, defaults to S times the point rate.
+        point_scale : float, optional
+            The scale factor for point data. Defaults to -1.
+
+        Returns
+        -------
+        writer : `c3d.writer.Writer`
+            Writer instance containing the frames.
+
+        Example
+        -------
+        >>> w = c3d.Writer.from_arrays(np.random.randn(1000, 24, 5), np.zeros((1000, 0, 0)), point_rate=200)
+        >>> w.set_point_labels(None)
+        >>> w.set_analog_labels(None)
+        >>> with open('random-points.c3d', 'wb') as handle:
+        >>>     w.write(handle)
+        '''
+        if analog_rate is None:
+            analog_rate = point_rate * np.shape(analog)[2] if np.ndim(analog) == 3 else 0.
+        writer = Writer(point_rate, analog_rate, point_scale)
+        writer.set_data(points, analog)
+        return writer
+
+    @staticmethod
+    def from_reader(reader, conversion=None):
+        ''' Convert a `c3d.reader.Reader` to a persistent `c3d.writer.Writer` instance.
+
+        Parameters
+        ----------
+        source : `c3d.reader.Reader`
+            Source to copy data from.
+        conversion : str
+            Conversion mode, None is equivalent to the default mode. Supported modes are:
+
+                'convert'       - (Default) Convert the Reader to a Writer
+                                  instance and explicitly delete the Reader.
+
+                'copy'          - Reader objects will be deep copied.
+
+                'copy_metadata' - Similar to 'copy' but only copies metadata and
+                                  not point and analog frame data.
+
+                'copy_shallow'  - Similar to 'copy' but group parameters are
+                                  not copied.
+
+                'copy_header'   - Similar to 'copy_shallow' but only the
+                                  header is copied (frame data is not copied).
+
+                'passthrough'   - Similar to 'copy' but frames are not decoded,
+                                  the data section is copied block-for-block from
+                                  the reader's file handle when written. Frames are
+                                  decoded and encoded if frames are added or if
+                                  parameters used to encode frames are modified
+                                  (such as POINT:USED, POINT:SCALE or ANALOG:SCALE).
+                                  The reader's file handle must remain open until the
+                                  writer is written.
+
+        Returns
+        -------
+        param : `c3d.writer.Writer`
+            A writeable and persistent representation of the `c3d.reader.Reader` object.
+
+        Raises
+        ------
+        ValueError
+            If mode string is not equivalent to one of the supported modes.
+            If attempting to convert non-Intel files using mode other than 'shallow_copy'.
+
+        Example
+        -------
+        >>> reader = c3d.Reader(open('capture.c3d', 'rb'))
+        >>> writer = reader.to_writer('passthrough')
+        >>> writer.point_group.set_str('UNITS', 'Units used for point data measurements.', 'm')
+        >>> with open('capture-m.c3d', 'wb') as handle:
+        >>>     writer.write(handle)
+        '''
+        writer = Writer()
+        # Modes
+        is_header_only = conversion == 'copy_header'
+        is_meta_copy = conversion == 'copy_metadata'
+        is_meta_only = is_header_only or is_meta_copy
+        is_consume = conversion == 'convert' or conversion is None
+        is_shallow_copy = conversion == 'shallow_copy' or is_header_only
+        is_passthrough = conversion == 'passthrough'
+        is_deep_copy = conversion == 'copy' or is_meta_copy or is_passthrough
+        # Verify mode
+        if not (is_consume or is_shallow_copy or is_deep_copy):
+            raise ValueError(
+                "Unknown mode argument {}. Supported modes are: 'consume', 'copy', 'passthrough' or "
+                "'shallow_copy'".format(
+                    conversion
+                ))
+        if not reader._dtypes.is_ieee and not is_shallow_copy:
+            # Can't copy/consume non-Intel files due to the uncertainty of converting parameter data.
+            raise ValueError(
+                "File was read in %s format and only 'shallow_copy' mode is supported for non Intel files!".format(
+                    reader._dtypes.proc_type
+                ))
+
+        if is_consume:
+            writer._header = reader._header
+            writer._groups = reader._groups
+        elif is_deep_copy:
+            writer._header = copy.deepcopy(reader._header)
+            writer._groups = copy.deepcopy(reader._groups)
+        elif is_shallow_copy:
+            # Only copy header (no groups)
+            writer._header = copy.deepcopy(reader._header)
+            # Reformat header events
+            writer._header.encode_events(writer._header.events)
+
+            # Transfer a minimal set parameters
+            writer.set_start_frame(reader.first_frame)
+            writer.set_point_labels(reader.point_labels)
+            writer.set_analog_labels(reader.analog_labels)
+
+            gen_scale, analog_scales, analog_offsets = reader.get_analog_transform_parameters()
+            writer.set_analog_general_scale(gen_scale)
+            writer.set_analog_scales(analog_scales)
+            writer.set_analog_offsets(analog_offsets)
+
+        if is_passthrough and not reader._stream:
+            # Copy the data section when written
+            writer._source = reader
+            writer._source_encoding = writer._encoding_parameters()
+        elif not is_meta_only:
+            # Copy frames
+            writer._load_frames(reader)
+        if is_consume:
+            # Cleanup
+            reader._header = None
+            reader._groups = None
+            del reader
+        return writer
+
+    @property
+    def frame_data(self):
+        ''' Get (N, P, 5) point and (N, C, S) analog arrays of the frames added to the writer.
+
+        The arrays are views of the data stored in the writer, None if no frames were added.
+        '''
+        if self._points is None:
+            return None, None
+        return self._points[:self._frame_count], self._analog[:self._frame_count]
+
+    def set_data(self, points, analog):
+        '''Set the point and analog data of the writer, replacing previously added frames.
+
+        Contiguous arrays are stored without being copied, frames added later are
+        stored in a separate buffer.
+
+        Parameters
+        ----------
+        points : (N, P, 5) array
+            Point data for N frames, each frame formatted as the point data returned
+            from `c3d.reader.Reader.read_frames()`.
+        analog : (N, C, S) array
+            Analog data for N frames, where C is the number of analog channels and S
+            the number of analog samples per frame.
+        '''
+        points, analog = Writer._check_data(points, analog)
+        self._source = None
+        self._points, self._analog = points, analog
+        self._frame_count = len(points)
+
+    def add_data(self, points, analog, index=None):
+        '''Add blocks of point and analog data to the writer.
+
+        Parameters
+        ----------
+        points : (N, P, 5) array
+            Point data for N frames, see `Writer.set_data()`.
+        analog : (N, C, S) array
+            Analog data for N frames, see `Writer.set_data()`.
+        index : int or None
+            Insert the frames at the index, see `Writer.add_frames()`. Frames are appended if None.
+        '''
+        points, analog = Writer._check_data(points, analog)
+        if self._source is not None:
+            self._load_source()
+        if self._frame_count == 0:
+            self.set_data(points, analog)
+            return
+        if len(points) == 0:
+            return
+        for name, data, stored in (('point', points, self._points), ('analog', analog, self._analog)):
+            if data.shape[1:] != stored.shape[1:]:
+                raise ValueError(
+                    'Shape of {} data does not match previous frames. Expected shape {}, was {}.'.format(
+                        name, str(stored.shape[1:]), str(data.shape[1:])))
+
+        size, count = self._frame_count, len(points)
+        index = size if index is None else slice(index, index).indices(size)[0]
+        point_dtype = np.promote_types(self._points.dtype, points.dtype)
+        analog_dtype = np.promote_types(self._analog.dtype, analog.dtype)
+        if size + count > len(self._points) or point_dtype != self._points.dtype or \
+           analog_dtype != self._analog.dtype:
+            # Grow the buffers by at least a factor 2, so repeated insertions are amortized
+            capacity = max(size + count, 2 * size)
+            self._points = Writer._grow(self._points[:size], capacity, point_dtype)
+            self._analog = Writer._grow(self._analog[:size], capacity, analog_dtype)
+        # Move frames following the index and insert
+        self._points[index + count:size + count] = self._points[index:size]
+        self._analog[index + count:size + count] = self._analog[index:size]
+        self._points[index:index + count] = points
+        self._analog[index:index + count] = analog
+        self._frame_count = size + count
+
+    def add_frames(self, frames, index=None):
+        '''Add frames to this writer instance.
+
+        Parameters
+        ----------
+        frames : Single or sequence of (point, analog) pairs
+            A sequence or frame of frame data to add to the writer.
+        index : int or None
+            Insert the frame or sequence at the index (the first sequence frame will be inserted at the given `index`).
+            Note that the index should be relative to 0 rather then the frame number provided by read_frames()!
+        '''
+        if len(frames) == 0:
+            return
+        if Writer._is_frame(frames):
+            frames = [frames]
+        if any(len(frame) != 2 for frame in frames):
+            raise ValueError('Expected frame input to be sequence of point and analog pairs on form (None, 2).')
+
+        data = []
+        for name, i in (('point', 0), ('analog', 1)):
+            try:
+                data.append(np.stack([frame[i] for frame in frames]))
+            except ValueError:
+                raise ValueError('Shape of {} data differs between the added frames.'.format(name))
+        self.add_data(*data, index=index)
+
+    def _load_frames(self, reader):
+        '''Decode and add every frame of a reader.'''
+        for _, points, analog in reader.read_blocks(camera_sum=False):
+            self.add_data(points, analog)
+
+    def _load_source(self):
+        '''Decode the frames of the data section otherwise copied when written.'''
+        reader, self._source = self._source, None
+        self._load_frames(reader)
+
+    def _encoding_parameters(self):
+        '''Get the parameters determining how frames are encoded in the data section.'''
+        transform = AnalogTransform.from_manager(self)
+        return (self.point_used, self.analog_used, self.analog_per_frame, self.point_scale,
+                transform.scales.tolist(), transform.offsets.tolist())
+
+    @staticmethod
+    def _is_frame(frames):
+        '''Check if the argument is a single (point, analog) pair rather than a sequence of pairs.'''
+        points = frames[0]
+        if isinstance(points, np.ndarray):
+            return points.ndim == 2
+        # Rows of point data contain 5 numbers, while entries in a sequence of frames are pairs of arrays
+        return len(points) == 0 or np.ndim(points[0]) == 1
+
+    @staticmethod
+    def _grow(data, capacity, dtype):
+        '''Copy an array into a larger buffer with room for `capacity` entries along the first axis.'''
+        out = np.empty((capacity,) + data.shape[1:], dtype)
+        out[:len(data)] = data
+        return out
+
+    def write(self, handle):
+        '''Write metadata, point and analog frames to a file handle.
+
+        Parameters
+        ----------
+        handle : file
+            Write metadata and C3D motion frames to the given file handle. The
+            writer does not close the handle.
+        '''
+        if self._source is not None and self._encoding_parameters() != self._source_encoding:
+            self._load_source()
+        if self._source is not None:
+            self._write_source(handle)
+            return
+        if self._frame_count == 0:
+            raise RuntimeError('Attempted to write empty file.')
+
+        points, analog = self.frame_data
+        self._set_frame_metadata(points.shape[1], analog.shape[1:], self._frame_count)
+        self._set_data_start(self.parameter_blocks() + 2)
+
+        self._write_metadata(handle)
+        self._write_frames(handle)
+
+    def _write_source(self, handle):
+        '''Write metadata followed by the data section copied from the source reader.'''
+        reader = self._source
+        nframes = reader.verify_layout().complete_frames
+        if nframes == 0:
+            raise RuntimeError('Attempted to write empty file.')
+        self._set_frame_metadata(reader.point_used, (reader.analog_used, reader.analog_per_frame), nframes)
+        self._set_data_start(self.parameter_blocks() + 2)
+        self._write_metadata(handle)
+
+        reader._handle.seek(reader._metadata_size())
+        remaining = nframes * reader._frame_dtype().itemsize
+        while remaining > 0:
+            data = reader._handle.read(min(remaining, _BLOCK_BYTES))
+            if not data:
+                raise EOFError('Reached end of file while copying the data section.')
+            handle.write(data)
+            remaining -= len(data)
+        self._pad_block(handle)
+
     def _write_frames(self, handle):
         '''Write our frame data to the given file handle.
 
@@ -475,34 +786,9 @@ class Writer(Manager):
             writer does not close the handle.
         '''
         assert handle.tell() == 512 * (self._header.data_block - 1)
-        scale_mag = abs(self.point_scale)
-        is_float = self.point_scale < 0
-        if is_float:
-            point_dtype = self._dtypes.float32
-            point_scale = 1.0
-        else:
-            point_dtype = self._dtypes.int16
-            point_scale = scale_mag
-        raw = np.zeros((self.point_used, 4), point_dtype)
-
-        analog_scales, analog_offsets = self.get_analog_transform()
-        analog_scales_inv = 1.0 / analog_scales
-
-        for points, analog in self._frames:
-            # Transform point data
-            valid = points[:, 3] >= 0.0
-            raw[~valid, 3] = -1
-            raw[valid, :3] = points[valid, :3] / point_scale
-            raw[valid, 3] = np.bitwise_or(np.rint(points[valid, 3] / scale_mag).astype(np.uint8),
-                                          (points[valid, 4].astype(np.uint16) << 8),
-                                          dtype=np.uint16)
-
-            # Transform analog data
-            analog = analog * analog_scales_inv + analog_offsets
-            analog = analog.T
-
-            # Write
-            analog = analog.astype(point_dtype)
-            handle.write(raw.tobytes())
-            handle.write(analog.tobytes())
+        points, analog = self.frame_data
+        encoder = _FrameEncoder(self, points.shape[1], analog.shape[1:])
+        for i in range(0, len(points), encoder.frames_per_block):
+            j = i + encoder.frames_per_block
+            handle.write(encoder.encode(points[i:j], analog[i:j]))
         self._pad_block(handle)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+'''Verify the data section layout of C3D files, without reading frame data.'''
+
+from __future__ import print_function
+
+import argparse
+import sys
+import warnings
+try:
+    import c3d
+except ModuleNotFoundError:
+    import os
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..\\'))
+    import c3d
+
+parser = argparse.ArgumentParser(description='Verify the data section layout of C3D files, without reading frame data.')
+parser.add_argument('input', metavar='FILE', nargs='+', help='check these C3D files')
+parser.add_argument('-q', '--quiet', action='store_true', help='only report files with issues')
+
+
+def check(filename):
+    '''Check a file, returning a list of issues and the layout (or None if the file could not be read).'''
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        try:
+            with open(filename, 'rb') as handle:
+                layout = c3d.Reader(handle, lazy=True).verify_layout()
+        except Exception as err:
+            return ['could not read metadata: {}'.format(err)], None
+    return layout.issues, layout
+
+
+def main(args):
+    failed = 0
+    for filename in args.input:
+        issues, layout = check(filename)
+        if issues:
+            failed += 1
+            print('{}: FAILED'.format(filename))
+            for issue in issues:
+                print('    {}'.format(issue))
+        elif not args.quiet:
+            print('{}: OK ({} frames)'.format(filename, layout.complete_frames))
+    if len(args.input) > 1 and not args.quiet:
+        print('{} of {} files OK'.format(len(args.input) - failed, len(args.input)))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(parser.parse_args()))
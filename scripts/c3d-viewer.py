@@ -17,6 +17,8 @@ from pyglet.gl import *
 
 parser = argparse.ArgumentParser(description='A simple OpenGL viewer for C3D files.')
 parser.add_argument('inputs', nargs='+', metavar='FILE', help='show these c3d files')
+parser.add_argument('--cache-mb', type=int, default=256, metavar='MB',
+                    help='size of the cache of decoded frames, in megabytes (default 256)')
 
 BLACK = (0, 0, 0)
 WHITE = (1, 1, 1)
@@ -95,7 +97,7 @@ class Viewer(pyglet.window.Window):
             width=800, height=450, resizable=True, vsync=False, config=config)
 
         self.c3d_reader = c3d_reader
-        self._frames = iter(())
+        self._frame_no = c3d_reader.first_frame - 1
         self._frame_rate = c3d_reader.header.frame_rate
 
         self._maxlen = 16
@@ -189,11 +191,13 @@ class Viewer(pyglet.window.Window):
         elif key == k.UNDERSCORE or key == k.MINUS:
             self._maxlen = max(1, self._maxlen / 2)
             self._reset_trails()
-        elif key == k.RIGHT:
+        elif key == k.RIGHT or key == k.LEFT:
             skip = int(self._frame_rate)
             if modifiers:
                 skip *= 10
-            [self._next_frame() for _ in range(skip)]
+            if key == k.LEFT:
+                skip = -skip
+            self._seek(self._frame_no + skip)
 
     def on_draw(self):
         self.clear()
@@ -222,18 +226,23 @@ class Viewer(pyglet.window.Window):
     def _reset_trails(self):
         self._trails = [collections.deque(t, self._maxlen) for t in self._trails]
 
+    def _wrap(self, frame_no):
+        first_frame, last_frame = self.c3d_reader.first_frame, self.c3d_reader.last_frame
+        return first_frame + (frame_no - first_frame) % (last_frame - first_frame + 1)
+
+    def _seek(self, frame_no):
+        # Frames are served from the block cache of the reader, so seeking back is cheap
+        self._frame_no = self._wrap(frame_no)
+        self._trails = [collections.deque((), self._maxlen) for _ in self._trails]
+
     def _next_frame(self):
-        try:
-            return next(self._frames)
-        except StopIteration:
-            self._frames = self.c3d_reader.read_frames(copy=False)
-            return self._next_frame()
-            pyglet.app.exit()
+        self._frame_no = self._wrap(self._frame_no + 1)
+        return self.c3d_reader.frame(self._frame_no)
 
     def update(self, dt):
         if self.paused:
             return
-        for trail, point in zip(self._trails, self._next_frame()[1]):
+        for trail, point in zip(self._trails, self._next_frame()[0]):
             if point[3] > -1 or not len(trail):
                 trail.append(point[:3] / 1000.)
             else:
@@ -247,7 +256,7 @@ class Viewer(pyglet.window.Window):
 def main(args):
     for filename in args.inputs:
         try:
-            Viewer(c3d.Reader(open(filename, 'rb'))).mainloop()
+            Viewer(c3d.Reader(open(filename, 'rb'), block_cache=args.cache_mb * 2**20)).mainloop()
         except StopIteration:
             pass
 
@@ -23,7 +23,7 @@ parser.add_argument('input', default='-', metavar='FILE', nargs='+', help='proce
 
 
 def convert(filename, args, sep, end):
-    input = sys.stdin
+    input = sys.stdin.buffer
     output = sys.stdout
     open_file_streams = filename != '-'
     if open_file_streams:
@@ -31,7 +31,8 @@ def convert(filename, args, sep, end):
         output = open(filename.replace('.c3d', '.csv'), 'w')
 
     try:
-        for frame_no, points, analog in c3d.Reader(input).read_frames(copy=False, camera_sum=True):
+        reader = c3d.Reader(input, stream=not open_file_streams)
+        for frame_no, points, analog in reader.read_frames(copy=False, camera_sum=True):
             fields = [frame_no]
             for x, y, z, err, cam in points:
                 fields.append(str(x))
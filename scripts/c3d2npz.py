@@ -24,7 +24,7 @@ parser.add_argument("-v", "--verbose", help="increase output verbosity", action=
 
 
 def convert(filename, args):
-    input = sys.stdin
+    input = sys.stdin.buffer
     outname = '-'
     if filename != '-':
         input = open(filename, 'rb')
@@ -32,7 +32,7 @@ def convert(filename, args):
 
     points = []
     analog = []
-    for i, (_, p, a) in enumerate(c3d.Reader(input).read_frames()):
+    for i, (_, p, a) in enumerate(c3d.Reader(input, stream=filename == '-').read_frames()):
         points.append(p)
         analog.append(a)
         if not i % 10000 and i:
@@ -0,0 +1,53 @@
+''' Benchmark bulk decoding of identical files encoded for different processor formats.
+
+    Run from the root of the package directory using::
+
+        python -m test.benchmark_proc_format
+
+    Decode throughput of SGI/MIPS (big endian) files is expected to match INTEL files,
+    as the data section is converted to native byte order once per decoded block.
+'''
+import c3d
+import timeit
+import numpy as np
+from test.zipload import Zipload
+
+FILES = (
+    ('sample01.zip', 'Eb015pi.c3d', 'INTEL INT'),
+    ('sample01.zip', 'Eb015si.c3d', 'SGI INT'),
+    ('sample01.zip', 'Eb015vi.c3d', 'DEC INT'),
+    ('sample01.zip', 'Eb015pr.c3d', 'INTEL REAL'),
+    ('sample01.zip', 'Eb015sr.c3d', 'SGI REAL'),
+    ('sample01.zip', 'Eb015vr.c3d', 'DEC REAL'),
+)
+
+
+def benchmark(repeat=5, number=50):
+    ''' Print the number of frames decoded per second using `Reader.read_all()` for each file.
+
+    The data decoded for each file is compared to the data decoded from the INTEL file of
+    the same kind (INT or REAL) before timing, and the throughput is reported relative to it.
+    '''
+    Zipload.download()
+    reference = {}
+    for zf, fn, name in FILES:
+        reader = c3d.Reader(Zipload._get(zf, fn))
+        kind = name.split()[-1]
+        points, analog = reader.read_all()
+        if kind not in reference:
+            reference[kind] = points, analog, None
+        intel_points, intel_analog, intel_rate = reference[kind]
+        np.testing.assert_allclose(points, intel_points, rtol=1e-6, err_msg=name)
+        np.testing.assert_allclose(analog, intel_analog, rtol=1e-6, err_msg=name)
+
+        frames = len(reader.raw_frames())
+        seconds = min(timeit.repeat(reader.read_all, repeat=repeat, number=number)) / number
+        rate = frames / seconds
+        if intel_rate is None:
+            reference[kind] = points, analog, rate
+            intel_rate = rate
+        print('{:12s} {:>12.0f} frames/s {:>6.0%} of INTEL {}'.format(name, rate, rate / intel_rate, kind))
+
+
+if __name__ == '__main__':
+    benchmark()
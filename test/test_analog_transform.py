@@ -0,0 +1,53 @@
+''' Tests for the analog transform shared by readers and writers.
+'''
+import unittest
+import numpy as np
+from c3d.manager import AnalogTransform
+
+
+class AnalogTransformTest(unittest.TestCase):
+
+    def test_apply(self):
+        scales, offsets = np.array([0.5, 2.0, -1.0]), np.array([0, 10, -3])
+        raw = np.arange(-12, 12, dtype=np.int16).reshape(2, 3, 4)
+        analog = AnalogTransform(scales, offsets).apply(raw)
+        expected = (raw - offsets[:, np.newaxis]) * scales[:, np.newaxis]
+        assert np.array_equal(analog, expected), 'Transformed analog data differs from the expected values'
+
+    def test_apply_out(self):
+        transform = AnalogTransform([0.5, 2.0], [1, -1])
+        raw = np.arange(8, dtype=np.int16).reshape(2, 4)
+        out = np.empty((2, 4), np.float32)
+        assert transform.apply(raw, out) is out, 'Expected the output array to be returned'
+        assert np.array_equal(out, transform.apply(raw).astype(np.float32)), 'Output array differs'
+        view = np.arange(8, dtype=np.int16).reshape(4, 2).T
+        assert np.array_equal(transform.apply(view), transform.apply(view.copy())), 'Non-contiguous input differs'
+
+    def test_invert(self):
+        transform = AnalogTransform([0.5, 2.0, 4.0], [0, 10, -3])
+        raw = np.arange(-15, 15).reshape(3, 10)
+        assert np.array_equal(transform.invert(transform.apply(raw)), raw), 'Inverse transform differs'
+
+    def test_invert_negative_zero(self):
+        for transform in (AnalogTransform(np.ones(2), np.zeros(2)), AnalogTransform([0.5, 2.0], np.zeros(2))):
+            words = transform.invert(np.full((2, 3), -0.0))
+            assert not np.any(np.signbit(words)), 'Expected -0.0 to be written as 0.0'
+
+    def test_identity(self):
+        transform = AnalogTransform(np.ones(3), np.zeros(3))
+        assert transform.is_identity, 'Expected transform to be the identity'
+        assert not AnalogTransform([1.0, 1.0], [0, 1]).is_identity, 'Expected offset transform not to be the identity'
+        analog = np.arange(6.0).reshape(3, 2)
+        assert transform.apply(analog, analog) is analog, 'Expected the identity to be applied in place'
+        assert np.array_equal(transform.apply(analog), analog), 'Identity transform changed the data'
+
+    def test_select(self):
+        transform = AnalogTransform([0.5, 2.0, 4.0], [0, 10, -3])
+        selected = transform.select([2, 0])
+        assert np.array_equal(selected.scales, [4.0, 0.5]), 'Selected scales differ'
+        assert np.array_equal(selected.offsets, [-3, 0]), 'Selected offsets differ'
+        assert transform.select(None) is transform, 'Expected no selection to return the transform'
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+''' Tests for reading files using c3d.AsyncReader.
+'''
+import asyncio
+import c3d
+import unittest
+import numpy as np
+from test.base import Base
+from test.zipload import Zipload
+
+
+class ByteSource():
+    ''' Asynchronous byte source returning data in chunks of limited size. '''
+    def __init__(self, handle, chunk_size=1000):
+        self.handle = handle
+        self.chunk_size = chunk_size
+
+    async def read(self, n):
+        await asyncio.sleep(0)
+        return self.handle.read(min(n, self.chunk_size))
+
+    async def seek(self, offset):
+        self.handle.seek(offset)
+
+
+class AsyncReaderTest(Base):
+    ''' Test reading files using the AsyncReader
+    '''
+    ZIP = 'sample01.zip'
+    FILES = ['Eb015pi.c3d', 'Eb015pr.c3d', 'Eb015sr.c3d', 'Eb015vr.c3d']
+
+    def test_read_blocks(self):
+        async def read(file):
+            reader = await c3d.AsyncReader.open(ByteSource(Zipload._get(self.ZIP, file)))
+            return reader, [block async for block in reader.read_blocks(100)]
+
+        for file in self.FILES:
+            r = c3d.Reader(Zipload._get(self.ZIP, file))
+            points, analog = r.read_all()
+            reader, blocks = asyncio.run(read(file))
+            assert reader.point_rate == r.point_rate and reader.frame_count == r.frame_count, \
+                'Mismatch in metadata for {}'.format(file)
+            assert np.array_equal(np.concatenate([b[1] for b in blocks]), points), \
+                'Point data differs for {}'.format(file)
+            assert np.array_equal(np.concatenate([b[2] for b in blocks]), analog), \
+                'Analog data differs for {}'.format(file)
+
+    def test_read_all(self):
+        async def read(file):
+            reader = await c3d.AsyncReader.open(ByteSource(Zipload._get(self.ZIP, file)))
+            return await reader.read_all()
+
+        for file in self.FILES:
+            points, analog = c3d.Reader(Zipload._get(self.ZIP, file)).read_all()
+            p, a = asyncio.run(read(file))
+            assert np.array_equal(p, points) and np.array_equal(a, analog), 'Data differs for {}'.format(file)
+
+    def test_metadata(self):
+        async def open_reader(file):
+            return await c3d.AsyncReader.open(ByteSource(Zipload._get(self.ZIP, file)))
+
+        for file in self.FILES:
+            r = c3d.Reader(Zipload._get(self.ZIP, file))
+            reader = asyncio.run(open_reader(file))
+            assert np.array_equal(reader.point_labels, r.point_labels), 'Mismatch in point labels for {}'.format(file)
+            assert reader.get('POINT:USED').int16_value == r.point_used, 'Mismatch in parameters for {}'.format(file)
+            # Methods reading frames from a file handle are not provided
+            for name in ('frame', 'read_frames', 'raw_frames', 'to_writer', 'verify_layout'):
+                assert not hasattr(reader, name), 'Expected AsyncReader to not provide {}()'.format(name)
+            with self.assertRaises(TypeError):
+                reader[1:100]
+
+
+if __name__ == '__main__':
+    unittest.main()
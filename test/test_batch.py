@@ -0,0 +1,65 @@
+''' Tests for loading batches of files using c3d.batch.
+'''
+import c3d
+import c3d.batch
+import os
+import unittest
+import numpy as np
+from test.base import Base
+from test.zipload import Zipload, TEMP
+
+
+class BatchTest(Base):
+    ''' Test loading files using a process pool.
+    '''
+    ZIP = 'sample01.zip'
+    FILES = ['Eb015pi.c3d', 'Eb015pr.c3d', 'Eb015si.c3d', 'Eb015sr.c3d', 'Eb015vi.c3d', 'Eb015vr.c3d']
+
+    def setUp(self):
+        super(BatchTest, self).setUp()
+        Zipload.extract(self.ZIP)
+        self.paths = [os.path.join(TEMP, 'sample01', file) for file in self.FILES]
+
+    def test_load_many(self):
+        missing = os.path.join(TEMP, 'sample01', 'missing.c3d')
+        results = {r.path: r for r in c3d.batch.load_many(self.paths + [missing], workers=2)}
+        assert len(results) == len(self.paths) + 1, 'Expected one result per file'
+        assert not results[missing].ok, 'Expected loading a missing file to capture an error'
+        for path in self.paths:
+            result = results[path]
+            assert result.ok, 'Failed to load {}: {}'.format(path, result.error)
+            with open(path, 'rb') as handle:
+                reader = c3d.Reader(handle)
+                points, analog = reader.read_all()
+            assert result.metadata.point_rate == reader.point_rate, 'Mismatch in metadata for {}'.format(path)
+            assert np.array_equal(result.points, points), 'Point data differs for {}'.format(path)
+            assert np.array_equal(result.analog, analog), 'Analog data differs for {}'.format(path)
+
+    def test_load_many_columns(self):
+        columns = {'points': [2, 0], 'analog': [1]}
+        for result in c3d.batch.load_many(self.paths[:2], workers=2, columns=columns):
+            with open(result.path, 'rb') as handle:
+                points, analog = c3d.Reader(handle).read_all(**columns)
+            assert np.array_equal(result.points, points), 'Point data differs for {}'.format(result.path)
+            assert np.array_equal(result.analog, analog), 'Analog data differs for {}'.format(result.path)
+
+        for result in c3d.batch.load_many(self.paths[:2], workers=2, metadata_only=True):
+            assert result.points is None and result.analog is None, 'Expected only metadata to be loaded'
+            assert result.metadata.frame_count > 0, 'Expected metadata for {}'.format(result.path)
+
+    def test_load_many_in_flight(self):
+        drawn = []
+
+        def paths():
+            for i in range(20):
+                drawn.append(i)
+                yield self.paths[i % len(self.paths)]
+
+        results = c3d.batch.load_many(paths(), workers=1)
+        assert next(results).ok, 'Expected the first file to load'
+        assert len(drawn) <= 3, 'Expected at most 2 files in flight per worker, {} were submitted'.format(len(drawn))
+        results.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,16 @@
 ''' Basic Reader and Writer tests.
 '''
 import c3d
+import concurrent.futures
 import importlib
 import io
+import os
+import sys
+import threading
 import unittest
 import numpy as np
 from test.base import Base
-from test.zipload import Zipload
+from test.zipload import Zipload, TEMP
 climate_spec = importlib.util.find_spec("climate")
 if climate_spec:
     import climate
@@ -85,6 +89,270 @@ class ReaderTest(Base):
         assert analog.shape == expected, \
             'analog shape: got {}, expected {}'.format(analog.shape, expected)
 
+    def test_read_all(self):
+        r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
+        self._log(r)
+        frames = list(r.read_frames())
+        points, analog = r.read_all()
+        assert points.shape == (len(frames), r.point_used, 5), \
+            'point shape: got {}, expected {}'.format(points.shape, (len(frames), r.point_used, 5))
+        assert np.array_equal(points, [p for _, p, _ in frames]), 'Point data differs from read_frames()'
+        assert np.array_equal(analog, [a for _, _, a in frames]), 'Analog data differs from read_frames()'
+
+    def test_read_blocks(self):
+        r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
+        points, analog = r.read_all()
+        blocks = list(r.read_blocks(100))
+        assert [len(b[0]) for b in blocks] == [100, 100, 100, 100, 50], 'Unexpected block sizes'
+        frame_nos = np.concatenate([b[0] for b in blocks])
+        assert np.array_equal(frame_nos, np.arange(r.first_frame, r.last_frame + 1)), 'Mismatch in frame numbers'
+        assert np.array_equal(np.concatenate([b[1] for b in blocks]), points), 'Block point data differs'
+        assert np.array_equal(np.concatenate([b[2] for b in blocks]), analog), 'Block analog data differs'
+
+    def test_read_workers(self):
+        r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
+        points, analog = r.read_all()
+        for workers in [2, 7]:
+            p, a = r.read_all(workers=workers)
+            assert np.array_equal(p, points) and np.array_equal(a, analog), \
+                'Data decoded using {} workers differs'.format(workers)
+            blocks = list(r.read_blocks(100, workers=workers))
+            assert np.array_equal(np.concatenate([b[1] for b in blocks]), points), 'Block point data differs'
+            assert np.array_equal(np.concatenate([b[2] for b in blocks]), analog), 'Block analog data differs'
+
+    def test_read_out_buffers(self):
+        r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
+        points, analog = r.read_all()
+        ring = [np.empty((r.point_used, 5), np.float32) for _ in range(2)]
+        for i, (_, p, a) in enumerate(r.read_frames(out_points=ring)):
+            assert p is ring[i % 2], 'Expected frame {} to be decoded into buffer {}'.format(i, i % 2)
+            assert np.array_equal(p, points[i]), 'Point data decoded into buffer differs for frame {}'.format(i)
+
+        out_points = np.empty((64, r.point_used, 5), np.float32)
+        out_analog = np.empty((64, r.analog_used, r.analog_per_frame))
+        frame_nos = []
+        for fn, p, a in r.read_blocks(64, out_points=out_points, out_analog=out_analog):
+            assert np.shares_memory(p, out_points) and np.shares_memory(a, out_analog), 'Expected views of buffers'
+            assert np.array_equal(p, points[fn - r.first_frame]), 'Block point data differs'
+            assert np.array_equal(a, analog[fn - r.first_frame]), 'Block analog data differs'
+            frame_nos.extend(fn)
+        assert len(frame_nos) == len(points), 'Expected all frames to be read'
+        with self.assertRaises(ValueError):
+            list(r.read_blocks(32, out_points=out_points))
+
+    def test_read_frame_range(self):
+        r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
+        frames = list(r.read_frames())
+        for start, stop, step in [(100, 200, 1), (5, None, 7), (None, 10, 3), (r.last_frame, None, 1)]:
+            expected = [f for f in frames if (start is None or f[0] >= start) and (stop is None or f[0] < stop)]
+            expected = expected[::step]
+            sliced = list(r.read_frames(start=start, stop=stop, step=step))
+            assert [f[0] for f in sliced] == [f[0] for f in expected], \
+                'Mismatch in frame numbers read for range ({}, {}, {})'.format(start, stop, step)
+            for (_, p0, a0), (_, p1, a1) in zip(expected, sliced):
+                assert np.array_equal(p0, p1) and np.array_equal(a0, a1), 'Sliced frame data differs'
+
+        frame_no, points, analog = frames[200]
+        p, a = r.frame(frame_no)
+        assert np.array_equal(points, p) and np.array_equal(analog, a), 'Frame {} differs'.format(frame_no)
+        with self.assertRaises(IndexError):
+            r.frame(r.last_frame + 1)
+
+    def test_read_columns(self):
+        r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
+        points, analog = r.read_all()
+        point_labels = [label.strip() for label in r.point_labels[:r.point_used]]
+        analog_labels = [label.strip() for label in r.analog_labels[:r.analog_used]]
+        pindex, aindex = [3, 0, r.point_used - 1], [1, r.analog_used - 1]
+        pselect = [point_labels[3], 0, point_labels[-1]]
+        aselect = [analog_labels[1], r.analog_used - 1]
+
+        p, a = r.read_all(points=pselect, analog=aselect)
+        assert np.array_equal(p, points[:, pindex]), 'Mismatch in selected point columns'
+        assert np.array_equal(a, analog[:, aindex]), 'Mismatch in selected analog channels'
+        for i, (_, p, a) in enumerate(r.read_frames(points=pselect, analog=aselect)):
+            assert np.array_equal(p, points[i, pindex]), 'Mismatch in selected point columns for frame {}'.format(i)
+            assert np.array_equal(a, analog[i, aindex]), 'Mismatch in selected analog channels for frame {}'.format(i)
+        with self.assertRaises(KeyError):
+            r.read_all(points=['NOT A LABEL'])
+
+    def test_label_index(self):
+        r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
+        point_labels = [label.strip() for label in r.point_labels[:r.point_used]]
+        analog_labels = [label.strip() for label in r.analog_labels[:r.analog_used]]
+        for i, label in enumerate(point_labels):
+            assert r.point_index(label) == point_labels.index(label), 'Mismatch in index of point {}'.format(label)
+        for i, label in enumerate(analog_labels):
+            assert r.analog_index(label) == analog_labels.index(label), 'Mismatch in index of channel {}'.format(label)
+        with self.assertRaises(KeyError):
+            r.point_index('NOT A LABEL')
+
+    def test_read_camera_mask(self):
+        r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
+        points, analog = r.read_all(camera_sum=True)
+        p, a, cameras = r.read_all(camera_sum=True, camera_mask=True)
+        assert cameras.dtype == np.uint8, 'Expected camera mask of type uint8, was {}'.format(cameras.dtype)
+        assert np.array_equal(cameras, points[..., 4]), 'Camera sum differs from fifth point column'
+        assert np.array_equal(p, points[..., :4]), 'Point data differs when returning camera mask'
+        for i, (_, p, a, c) in enumerate(r.read_frames(camera_mask=True)):
+            assert np.array_equal(r.point_cameras(slice(i, i + 1))[0], c), 'Camera mask differs for frame {}'.format(i)
+
+    def test_read_dtypes(self):
+        r = c3d.Reader(Zipload._get('sample01.zip', 'Eb015pi.c3d'))
+        points, analog = r.read_all()
+        p, a = r.read_all(points_dtype='raw', analog_dtype=np.float32)
+        assert p.dtype == np.int16, 'Expected raw points of type int16, was {}'.format(p.dtype)
+        assert a.dtype == np.float32, 'Expected analog of type float32, was {}'.format(a.dtype)
+        assert np.allclose(p[..., :3] * abs(r.point_scale), points[..., :3]), 'Raw coordinates differ when scaled'
+        assert np.allclose(a, analog, rtol=1e-6), 'Analog data differs when decoded as float32'
+        for i, (_, p_frame, a_frame) in enumerate(r.read_frames(points_dtype='raw', analog_dtype=np.float32)):
+            assert np.array_equal(p_frame, p[i]), 'Raw point data differs for frame {}'.format(i)
+            assert np.array_equal(a_frame, a[i]), 'Analog data differs for frame {}'.format(i)
+        with self.assertRaises(ValueError):
+            c3d.Reader(Zipload._get('sample01.zip', 'Eb015pr.c3d')).read_all(points_dtype='raw')
+        # Integer data types truncating the decoded data are rejected
+        for file in ['Eb015pi.c3d', 'Eb015pr.c3d']:
+            with self.assertRaises(ValueError):
+                c3d.Reader(Zipload._get('sample01.zip', file)).read_all(points_dtype=np.int16)
+            with self.assertRaises(ValueError):
+                c3d.Reader(Zipload._get('sample01.zip', file)).read_all(analog_dtype=np.int32)
+        a = r.read_all(analog_transform=False, analog_dtype=np.int16)[1]
+        assert np.array_equal(a, r.read_all(analog_transform=False)[1]), 'Analog words differ when read as int16'
+
+    def test_read_block_cache(self):
+        r = c3d.Reader(Zipload._get('sample01.zip', 'Eb015pr.c3d'), block_cache=c3d.cache.BlockCache(2**20, 64))
+        points, analog = r.read_all()
+        for i in (100, 3, 64, 63, len(points) - 1, 100):
+            p, a = r.frame(r.first_frame + i)
+            assert np.array_equal(p, points[i]), 'Point data differs for frame {}'.format(i)
+            assert np.array_equal(a, analog[i]), 'Analog data differs for frame {}'.format(i)
+        assert len(r._block_cache) == 3, 'Expected three cached blocks, was {}'.format(len(r._block_cache))
+        p, a = r[r.first_frame + 10:r.first_frame + 200:3]
+        assert np.array_equal(p, points[10:200:3]), 'Point data differs for slice of frames'
+        assert np.array_equal(a, analog[10:200:3]), 'Analog data differs for slice of frames'
+        p, a = c3d.Reader(Zipload._get('sample01.zip', 'Eb015pr.c3d'))[r.first_frame + 10:r.first_frame + 200:3]
+        assert np.array_equal(p, points[10:200:3]), 'Point data differs for slice of frames without a cache'
+
+    def test_read_shared_block_cache(self):
+        cache = c3d.cache.BlockCache(2**24)
+        readers = [c3d.Reader(Zipload._get('sample01.zip', file), block_cache=cache)
+                   for file in ('Eb015pi.c3d', 'Eb015pr.c3d')]
+        for r in readers:
+            p, a = r.frame(r.first_frame)
+        for file, r in zip(('Eb015pi.c3d', 'Eb015pr.c3d'), readers):
+            points, analog = c3d.Reader(Zipload._get('sample01.zip', file)).read_all()
+            p, a = r.frame(r.first_frame)
+            assert np.array_equal(p, points[0]), 'Point data differs for {} with a shared cache'.format(file)
+            assert np.array_equal(a, analog[0]), 'Analog data differs for {} with a shared cache'.format(file)
+        assert len(cache) == 2, 'Expected one cached block per reader, was {}'.format(len(cache))
+
+    def test_verify_layout(self):
+        data = Zipload._get('sample01.zip', 'Eb015pr.c3d').read()
+        layout = c3d.Reader(io.BytesIO(data)).verify_layout()
+        assert layout.ok, 'Expected layout to be valid, found issues: {}'.format(layout.issues)
+        assert layout.complete_frames == layout.expected_frames, 'Expected all frames to be complete'
+        data_end = layout.data_start + 100 * layout.frame_bytes + 10
+        truncated = c3d.Reader(io.BytesIO(data[:data_end])).verify_layout()
+        assert truncated.is_truncated and not truncated.ok, 'Expected layout of truncated file to be invalid'
+        assert truncated.complete_frames == 100, 'Expected 100 complete frames, was {}'.format(
+            truncated.complete_frames)
+        padded = c3d.Reader(io.BytesIO(data + bytes(1024))).verify_layout()
+        assert padded.is_padded and not padded.ok, 'Expected layout of padded file to be invalid'
+
+    def test_read_lazy(self):
+        r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
+        lazy = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'), lazy=True)
+        assert lazy.point_rate == r.point_rate and lazy.frame_count == r.frame_count, 'Mismatch in lazy metadata'
+        for (name, group), (lazy_name, lazy_group) in zip(r.items(), lazy.items()):
+            assert name == lazy_name, 'Mismatch in group order, {} != {}'.format(name, lazy_name)
+            for (key, p), (lazy_key, q) in zip(group.items(), lazy_group.items()):
+                assert key == lazy_key, 'Mismatch in parameter order, {} != {}'.format(key, lazy_key)
+                assert p.dimensions == q.dimensions and p.bytes_value == q.bytes_value and p.desc == q.desc, \
+                    'Mismatch in lazily parsed parameter {}:{}'.format(name, key)
+
+    def test_read_lazy_threads(self):
+        r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
+        expected = {(name, key): p.bytes_value for name, group in r.items() for key, p in group.items()}
+        # Switch threads often, to interleave the threads parsing the parameters
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+        for _ in range(10):
+            lazy = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'), lazy=True)
+            params = [(name, key, p) for name, group in lazy.items() for key, p in group.items()]
+            barrier = threading.Barrier(4)
+
+            def parse():
+                barrier.wait()
+                return [(name, key, p.bytes_value) for name, key, p in params]
+
+            with concurrent.futures.ThreadPoolExecutor(4) as pool:
+                for parsed in pool.map(lambda _: parse(), range(4)):
+                    for name, key, value in parsed:
+                        assert value == expected[name, key], 'Mismatch in parameter {}:{}'.format(name, key)
+
+        lazy = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'), lazy=True)
+        for a, b in zip(lazy.read_all(workers=4), r.read_all()):
+            assert np.array_equal(a, b), 'Mismatch in data decoded by several threads from a lazy reader'
+
+    def test_read_stream(self):
+        class Pipe(io.RawIOBase):
+            ''' Non-seekable stream. '''
+            def __init__(self, handle):
+                self.handle = handle
+
+            def readable(self):
+                return True
+
+            def read(self, size=-1):
+                return self.handle.read(size)
+
+        for file in ['Eb015pi.c3d', 'Eb015sr.c3d', 'Eb015vr.c3d']:
+            frames = list(c3d.Reader(Zipload._get('sample01.zip', file)).read_frames())
+            r = c3d.Reader(Pipe(Zipload._get('sample01.zip', file)), stream=True)
+            streamed = list(r.read_frames())
+            assert len(streamed) == len(frames), 'Expected {} frames, read {}'.format(len(frames), len(streamed))
+            for (i, p0, a0), (j, p1, a1) in zip(frames, streamed):
+                assert i == j and np.array_equal(p0, p1) and np.array_equal(a0, a1), \
+                    'Streamed frame {} differs for {}'.format(i, file)
+            with self.assertRaises(io.UnsupportedOperation):
+                list(r.read_frames())
+
+        pipe = Pipe(Zipload._get('sample01.zip', 'Eb015pi.c3d'))
+        with c3d.Reader(pipe, stream=True) as r:
+            assert len(list(r.read_frames())) == r.frame_count, 'Expected all frames to be streamed'
+        assert pipe.closed, 'Expected the stream to be closed when exiting the context'
+
+    def test_read_mmap(self):
+        Zipload.extract('sample01.zip')
+        for file in ['Eb015pr.c3d', 'Eb015sr.c3d', 'Eb015pi.c3d']:
+            with open(os.path.join(TEMP, 'sample01', file), 'rb') as handle:
+                r = c3d.Reader(handle, mmap=True)
+                frames = r.raw_frames()
+                assert isinstance(frames, np.memmap), 'Expected a memory-mapped data section for {}'.format(file)
+                points, analog = c3d.Reader(handle).read_all()
+                mpoints, manalog = r.read_all()
+                assert np.array_equal(points, mpoints), 'Point data differs in mmap mode for {}'.format(file)
+                assert np.array_equal(analog, manalog), 'Analog data differs in mmap mode for {}'.format(file)
+
+                residuals = r.point_residuals(slice(10, 20))
+                assert np.array_equal(residuals, points[10:20, :, 3]), 'Mismatch in residuals for {}'.format(file)
+                valid = residuals >= 0
+                xyz = r.point_coordinates(slice(10, 20))
+                assert np.array_equal(xyz[valid], points[10:20, :, :3][valid]), \
+                    'Mismatch in coordinates for {}'.format(file)
+                if r.point_scale < 0:
+                    assert np.shares_memory(xyz, frames), 'Expected coordinates to be a view for {}'.format(file)
+
+    def test_open_mmap(self):
+        Zipload.extract('sample01.zip')
+        path = os.path.join(TEMP, 'sample01', 'Eb015pr.c3d')
+        with c3d.Reader.open_mmap(path) as r:
+            frames = r.raw_frames()
+            points, _ = r.read_all()
+        assert r._handle.closed, 'Expected the file to be closed when exiting the context'
+        assert len(np.array(frames)) == len(points), 'Expected returned frames to remain valid after closing'
+
 
 class WriterTest(Base):
     ''' Test basic writer functionality
@@ -105,6 +373,99 @@ class WriterTest(Base):
         w.set_analog_general_scale(r.get('ANALOG:GEN_SCALE').float_value)
         w.write(h)
 
+    def test_from_arrays(self):
+        r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
+        points, analog = r.read_all()
+
+        def write(w):
+            w.set_point_labels(r.point_labels)
+            w.set_analog_labels(r.analog_labels)
+            w.set_analog_general_scale(r.get('ANALOG:GEN_SCALE').float_value)
+            h = io.BytesIO()
+            w.write(h)
+            return h.getvalue()
+
+        w = c3d.Writer(point_rate=r.point_rate, analog_rate=r.analog_rate, point_scale=r.point_scale)
+        w.add_frames([(p, a) for _, p, a in r.read_frames()])
+        expected = write(w)
+        w = c3d.Writer.from_arrays(points, analog, point_rate=r.point_rate, point_scale=r.point_scale)
+        assert w.analog_rate == r.analog_rate, 'Expected analog rate {}, was {}'.format(r.analog_rate, w.analog_rate)
+        assert write(w) == expected, 'Expected writing arrays and frames to produce equal files.'
+
+        # Insert blocks of frames
+        w = c3d.Writer.from_arrays(points[:10], analog[:10])
+        w.add_data(points[20:], analog[20:])
+        w.add_data(points[10:20], analog[10:20], index=10)
+        w.add_frames((points[0], analog[0]), index=0)
+        wpoints, wanalog = w.frame_data
+        assert np.array_equal(wpoints[1:], points) and np.array_equal(wanalog[1:], analog), \
+            'Expected frames to be inserted in order.'
+        assert np.array_equal(wpoints[0], points[0]), 'Expected frame to be inserted first.'
+
+        with self.assertRaises(ValueError):
+            w.add_data(points[:, :-1], analog)
+        with self.assertRaises(ValueError):
+            w.set_data(points, analog[1:])
+
+    def test_write_blocks(self):
+        r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
+        w = r.to_writer('copy')
+
+        def write():
+            h = io.BytesIO()
+            w.write(h)
+            return h.getvalue()
+
+        expected = write()
+        block_bytes = c3d.writer._BLOCK_BYTES
+        try:
+            # Encode a few frames at a time
+            c3d.writer._BLOCK_BYTES = 3 * r._frame_dtype().itemsize
+            assert write() == expected, 'Expected encoded data to be independent of the block size.'
+        finally:
+            c3d.writer._BLOCK_BYTES = block_bytes
+
+        points, analog = r.read_all()
+        wpoints, wanalog = c3d.Reader(io.BytesIO(expected)).read_all()
+        valid = points[:, :, 3] >= 0
+        assert np.array_equal(points[:, :, 3:], wpoints[:, :, 3:]), 'Expected written residuals to equal the source.'
+        assert np.array_equal(points[valid], wpoints[valid]), 'Expected written point data to equal the source.'
+        assert np.allclose(analog, wanalog), 'Expected written analog data to equal the source.'
+
+    def test_passthrough(self):
+        for file in ['Eb015pi.c3d', 'Eb015pr.c3d']:
+            r = c3d.Reader(Zipload._get('sample01.zip', file))
+            data_start, data_bytes = r._metadata_size(), r.frame_count * r._frame_dtype().itemsize
+            r._handle.seek(data_start)
+            data = r._handle.read(data_bytes)
+
+            w = r.to_writer('passthrough')
+            labels = list(r.point_labels)
+            labels[0] = 'RENAMED'
+            w.point_group.remove_param('LABELS')
+            w.set_point_labels(labels)
+            w.point_group.add_str('NOTES', 'Notes growing the parameter section', 'x' * 2000, 200, 10)
+            h = io.BytesIO()
+            w.write(h)
+
+            wr = c3d.Reader(io.BytesIO(h.getvalue()))
+            assert wr.header.data_block > r.header.data_block, 'Expected data section to be moved for {}'.format(file)
+            assert wr.verify_layout().ok, 'Expected a valid layout for {}, {}'.format(file, wr.verify_layout().issues)
+            assert wr.point_labels[0] == 'RENAMED', 'Expected point label to be renamed for {}'.format(file)
+            assert h.getvalue()[wr._metadata_size():wr._metadata_size() + data_bytes] == data, \
+                'Expected data section to be copied for {}'.format(file)
+
+            # Changing the encoding of frames is equivalent to copying
+            writers = r.to_writer('passthrough'), r.to_writer('copy')
+            output = []
+            for w in writers:
+                w.point_group.set('SCALE', 'Point data scaling factor', 4, '<f', -1.0)
+                w.header.scale_factor = np.float32(-1.0)
+                h = io.BytesIO()
+                w.write(h)
+                output.append(h.getvalue())
+            assert output[0] == output[1], 'Expected frames to be encoded for {}'.format(file)
+
     def test_set_params(self):
         r = c3d.Reader(Zipload._get('sample08.zip', 'TESTDPI.c3d'))
         w = c3d.Writer(
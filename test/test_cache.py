@@ -0,0 +1,71 @@
+''' Tests for caching decoded data using c3d.cache.
+'''
+import c3d
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from test.base import Base
+from test.zipload import Zipload, TEMP
+
+
+class CacheTest(Base):
+    ''' Test loading files through an on-disk cache.
+    '''
+    ZIP = 'sample01.zip'
+    FILES = ['Eb015pi.c3d', 'Eb015pr.c3d', 'Eb015si.c3d', 'Eb015sr.c3d', 'Eb015vi.c3d', 'Eb015vr.c3d']
+
+    def setUp(self):
+        super(CacheTest, self).setUp()
+        Zipload.extract(self.ZIP)
+        self.paths = [os.path.join(TEMP, 'sample01', file) for file in self.FILES]
+        self.directory = tempfile.mkdtemp()
+        self.cache = c3d.cache.Cache(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_read_cached(self):
+        for path in self.paths:
+            with open(path, 'rb') as handle:
+                points, analog = c3d.Reader(handle).read_all()
+            with open(path, 'rb') as handle:
+                p, a = c3d.Reader(handle, cache=self.cache).read_all()
+            assert not isinstance(p, np.memmap), 'Expected first load of {} to be decoded'.format(path)
+            with open(path, 'rb') as handle:
+                p, a = c3d.Reader(handle, cache=self.cache).read_all()
+            assert isinstance(p, np.memmap), 'Expected second load of {} to be served from the cache'.format(path)
+            assert np.array_equal(p, points, equal_nan=True), 'Cached point data differs for {}'.format(path)
+            assert np.array_equal(a, analog, equal_nan=True), 'Cached analog data differs for {}'.format(path)
+            with open(path, 'rb') as handle:
+                p, a, cameras = c3d.Reader(handle, cache=self.cache).read_all(camera_mask=True)
+            assert p.shape[-1] == 4, 'Expected arguments to be part of the cache key'
+
+    def test_invalidate(self):
+        path = os.path.join(self.directory, 'trial.c3d')
+        shutil.copy(self.paths[0], path)
+        with open(path, 'rb') as handle:
+            c3d.Reader(handle, cache=self.cache).read_all()
+        os.utime(path, ns=(0, 0))
+        with open(path, 'rb') as handle:
+            p, a = c3d.Reader(handle, cache=self.cache).read_all()
+        assert not isinstance(p, np.memmap), 'Expected modified file to be decoded'
+
+    def test_evict(self):
+        for path in self.paths:
+            with open(path, 'rb') as handle:
+                c3d.Reader(handle, cache=self.cache).read_all()
+        size = self.cache.size
+        self.cache.max_bytes = size // 2
+        self.cache.evict()
+        assert 0 < self.cache.size <= size // 2, 'Expected cache to be reduced to the size limit'
+        with open(self.paths[-1], 'rb') as handle:
+            p, a = c3d.Reader(handle, cache=self.cache).read_all()
+        assert isinstance(p, np.memmap), 'Expected the most recently used entry to be kept'
+        self.cache.clear()
+        assert self.cache.size == 0, 'Expected cache to be empty'
+
+
+if __name__ == '__main__':
+    unittest.main()
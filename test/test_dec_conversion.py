@@ -0,0 +1,61 @@
+''' Tests for converting DEC floating point values to IEEE format.
+'''
+import unittest
+import numpy as np
+from c3d.utils import DEC_to_IEEE, DEC_to_IEEE_BYTES
+
+
+def dec_reference(words):
+    ''' Compute DEC float values in double precision from the bit pattern definition. '''
+    words = words.astype(np.uint64)
+    swapped = ((words >> 16) | (words << 16)) & 0xFFFFFFFF
+    sign = np.where(swapped >> 31, -1.0, 1.0)
+    exponent = ((swapped >> 23) & 0xFF).astype(np.float64)
+    fraction = (swapped & 0x7FFFFF).astype(np.float64)
+    values = sign * (0.5 + fraction / 2**24) * np.exp2(exponent - 128)
+    values[exponent == 0] = np.where(sign[exponent == 0] < 0, np.nan, 0.0)
+    return values.astype(np.float32)
+
+
+class DECConversionTest(unittest.TestCase):
+    ''' Test DEC to IEEE conversion for all exponents.
+    '''
+    def setUp(self):
+        rng = np.random.default_rng(17)
+        words = rng.integers(0, 2**32, size=(256, 64), dtype=np.uint64).astype(np.uint32)
+        # Assign each row an exponent (bits 14-7 of the first 16-bit word)
+        self.words = (words & np.uint32(0xFFFF807F)) | (np.arange(256, dtype=np.uint32)[:, None] << np.uint32(7))
+        self.expected = dec_reference(self.words)
+
+    def assert_converted(self, values, expected):
+        nan = np.isnan(expected)
+        assert np.all(np.isnan(values[nan])), 'Expected reserved operands to be converted to NaN.'
+        assert np.array_equal(values[~nan].view(np.uint32), expected[~nan].view(np.uint32)), \
+            'Mismatch in converted values for exponents {}.'.format(
+                np.unique(np.nonzero(values[~nan] != expected[~nan])[0]))
+
+    def test_array(self):
+        self.assert_converted(DEC_to_IEEE(self.words), self.expected)
+        self.assert_converted(DEC_to_IEEE_BYTES(self.words.tobytes()).reshape(self.words.shape), self.expected)
+
+    def test_out(self):
+        out = np.zeros((256, 64, 2), dtype=np.float32)
+        result = DEC_to_IEEE(self.words, out[..., 1])
+        assert np.shares_memory(result, out), 'Expected values to be written to the output array.'
+        self.assert_converted(out[..., 1], self.expected)
+        assert np.all(out[..., 0] == 0), 'Conversion wrote outside of the output view.'
+
+    def test_out_dtype(self):
+        with self.assertRaises(ValueError):
+            DEC_to_IEEE(self.words, np.zeros(self.words.shape, dtype=np.float64))
+
+    def test_scalar(self):
+        for word, expected in zip(self.words[:, 0], self.expected[:, 0]):
+            value = DEC_to_IEEE(int(word))
+            assert isinstance(value, float), 'Expected a python float for a scalar input.'
+            assert value == expected or (np.isnan(value) and np.isnan(expected)), \
+                'Mismatch in converted scalar {} != {}.'.format(value, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+''' Tests for editing the metadata of files in place using c3d.edit_inplace.
+'''
+import c3d
+import os
+import tempfile
+import unittest
+import numpy as np
+from test.base import Base
+from test.zipload import Zipload
+
+
+class EditInplaceTest(Base):
+    ''' Test editing files in place
+    '''
+    ZIP = 'sample01.zip'
+    FILES = ['Eb015pi.c3d', 'Eb015pr.c3d']
+
+    def setUp(self):
+        super(EditInplaceTest, self).setUp()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def copy(self, file):
+        ''' Copy a test file to the temporary directory. '''
+        path = os.path.join(self.directory.name, file)
+        with open(path, 'wb') as handle:
+            handle.write(Zipload._get(self.ZIP, file).read())
+        with open(path, 'rb') as handle:
+            return path, handle.read()
+
+    def test_edit_parameter(self):
+        for file in self.FILES:
+            path, source = self.copy(file)
+            data_start = c3d.Reader(Zipload._get(self.ZIP, file))._metadata_size()
+
+            with c3d.edit_inplace(path):
+                pass
+            with open(path, 'rb') as handle:
+                assert handle.read() == source, 'Expected unchanged metadata to not modify {}'.format(file)
+
+            with c3d.edit_inplace(path) as writer:
+                writer.point_group.set_str('UNITS', 'Units used for point data measurements.', 'm')
+            with open(path, 'rb') as handle:
+                edited = handle.read()
+            assert len(edited) == len(source) and edited[data_start:] == source[data_start:], \
+                'Expected data section of {} to be unchanged'.format(file)
+            with open(path, 'rb') as handle:
+                r = c3d.Reader(handle)
+                assert r.get('POINT:UNITS').string_value.strip() == 'm', 'Expected edited units for {}'.format(file)
+                assert r.verify_layout().ok, 'Expected a valid layout for {}'.format(file)
+
+    def test_frame_metadata(self):
+        for file in self.FILES:
+            path, source = self.copy(file)
+            r = c3d.Reader(Zipload._get(self.ZIP, file))
+            points, analog = r.read_all()
+
+            with c3d.edit_inplace(path) as writer:
+                writer.set_start_frame(5)
+            with open(path, 'rb') as handle:
+                edited = c3d.Reader(handle)
+                assert edited.first_frame == 5, 'Expected first frame 5, was {}'.format(edited.first_frame)
+                assert edited.frame_count == r.frame_count, \
+                    'Expected {} frames, was {} for {}'.format(r.frame_count, edited.frame_count, file)
+                assert edited.last_frame == 5 + r.frame_count - 1, 'Mismatch in last frame for {}'.format(file)
+                assert edited.verify_layout().ok, 'Expected a valid layout for {}'.format(file)
+                p, a = edited.read_all()
+                assert np.array_equal(p, points) and np.array_equal(a, analog), 'Data differs for {}'.format(file)
+
+    def test_permissions(self):
+        path, _ = self.copy(self.FILES[0])
+        os.chmod(path, 0o644)
+        with c3d.edit_inplace(path) as writer:
+            writer.point_group.add_str('NOTES', 'Notes growing the parameter section', 'x' * 10000, 250, 40)
+        assert os.stat(path).st_mode & 0o777 == 0o644, 'Expected file permissions to be kept.'
+
+    def test_rewrite(self):
+        for file in self.FILES:
+            path, source = self.copy(file)
+            points, analog = c3d.Reader(Zipload._get(self.ZIP, file)).read_all()
+
+            with self.assertRaises(ValueError):
+                with c3d.edit_inplace(path, rewrite=False) as writer:
+                    writer.point_group.add_str('NOTES', 'Notes growing the parameter section', 'x' * 10000, 250, 40)
+            with open(path, 'rb') as handle:
+                assert handle.read() == source, 'Expected {} to not be modified'.format(file)
+
+            with c3d.edit_inplace(path) as writer:
+                writer.point_group.add_str('NOTES', 'Notes growing the parameter section', 'x' * 10000, 250, 40)
+            with open(path, 'rb') as handle:
+                r = c3d.Reader(handle)
+                assert r.get('POINT:NOTES') is not None, 'Expected added parameter in {}'.format(file)
+                assert r.verify_layout().ok, 'Expected a valid layout for {}'.format(file)
+                p, a = r.read_all()
+                assert np.array_equal(p, points) and np.array_equal(a, analog), 'Data differs for {}'.format(file)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import c3d
+import numpy as np
 import unittest
 import test.verify as verify
 from test.base import Base
@@ -100,6 +101,21 @@ class FormatTest():
 
         print('INTEL-DEC-SGI REAL FORMAT COMPARISON: OK')
 
+    def test_f_read_all_formats(self):
+        ''' Compare data decoded in bulk from identical files for different processor formats.
+        '''
+
+        for intel, other in ((self.INTEL_INT, self.DEC_INT), (self.INTEL_INT, self.MIPS_INT),
+                             (self.INTEL_REAL, self.DEC_REAL), (self.INTEL_REAL, self.MIPS_REAL)):
+            intel_points, intel_analog = c3d.Reader(Zipload._get(self.ZIP, intel)).read_all()
+            points, analog = c3d.Reader(Zipload._get(self.ZIP, other)).read_all()
+            np.testing.assert_allclose(points, intel_points, rtol=1e-6, err_msg='{} - {}'.format(intel, other))
+            np.testing.assert_allclose(analog, intel_analog, rtol=1e-6, err_msg='{} - {}'.format(intel, other))
+            points64, _ = c3d.Reader(Zipload._get(self.ZIP, other)).read_all(points_dtype=np.float64)
+            np.testing.assert_allclose(points64, points, rtol=1e-6, err_msg='float64 {}'.format(other))
+
+        print('INTEL-DEC-SGI BULK FORMAT COMPARISON: OK')
+
 
 class Sample01(FormatTest, Base):
     ZIP = 'sample01.zip'
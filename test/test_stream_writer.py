@@ -0,0 +1,84 @@
+''' Tests for writing files using c3d.StreamWriter.
+'''
+import c3d
+import io
+import unittest
+import numpy as np
+from test.base import Base
+from test.zipload import Zipload
+
+
+class StreamWriterTest(Base):
+    ''' Test writing files using the StreamWriter
+    '''
+    ZIP = 'sample01.zip'
+    FILES = ['Eb015pi.c3d', 'Eb015pr.c3d']
+
+    def test_append(self):
+        for file in self.FILES:
+            r = c3d.Reader(Zipload._get(self.ZIP, file))
+            points, analog = r.read_all()
+
+            h = io.BytesIO()
+            with c3d.StreamWriter(h, point_rate=r.point_rate, analog_rate=r.analog_rate,
+                                  point_scale=r.point_scale) as w:
+                w.set_point_labels(r.point_labels)
+                w.set_analog_labels(r.analog_labels)
+                w.set_analog_general_scale(r.get('ANALOG:GEN_SCALE').float_value)
+                w.append(points[0], analog[0])
+                w.append_block(points[1:100], analog[1:100])
+                for i in range(100, len(points)):
+                    w.append(points[i], analog[i])
+                with self.assertRaises(ValueError):
+                    w.append_block(points[:, :-1], analog)
+
+            wr = c3d.Reader(io.BytesIO(h.getvalue()))
+            assert wr.frame_count == r.frame_count, \
+                'Expected {} frames, was {} for {}'.format(r.frame_count, wr.frame_count, file)
+            assert wr.last_frame == wr.first_frame + r.frame_count - 1, 'Mismatch in last frame for {}'.format(file)
+            assert wr.verify_layout().ok, 'Expected a valid layout for {}'.format(file)
+
+            # Data section is equal to the data written by a Writer
+            w = c3d.Writer.from_arrays(points, analog, point_rate=r.point_rate, point_scale=r.point_scale)
+            w.set_point_labels(r.point_labels)
+            w.set_analog_labels(r.analog_labels)
+            w.set_analog_general_scale(r.get('ANALOG:GEN_SCALE').float_value)
+            expected = io.BytesIO()
+            w.write(expected)
+            data_start = 512 * (wr.header.data_block - 1)
+            assert h.getvalue()[data_start:] == expected.getvalue()[512 * (w.header.data_block - 1):], \
+                'Expected streamed data section to equal the written data section for {}'.format(file)
+
+    def test_long_frames(self):
+        h = io.BytesIO()
+        with c3d.StreamWriter(h, point_rate=100) as w:
+            w.set_point_labels(['A'])
+            w.set_analog_labels(None)
+            for i in range(7):
+                w.append_block(np.full((10000, 1, 5), i, np.float32), np.zeros((10000, 0, 0)))
+
+        r = c3d.Reader(io.BytesIO(h.getvalue()))
+        assert r.frame_count == 70000, 'Expected 70000 frames, was {}'.format(r.frame_count)
+        assert r.get('POINT:LONG_FRAMES') is not None, 'Expected POINT:LONG_FRAMES parameter.'
+        assert r.header.last_frame == 65535, 'Expected header.last_frame to be clamped.'
+        points, _ = r.read_all()
+        assert np.array_equal(points[::10000, 0, 0], np.arange(7)), 'Mismatch in streamed point data.'
+
+    def test_frame_methods(self):
+        w = c3d.StreamWriter(io.BytesIO())
+        assert not isinstance(w, c3d.Writer), 'Expected StreamWriter to not be a Writer.'
+        for name in ('write', 'set_data', 'add_data', 'add_frames'):
+            assert not hasattr(w, name), 'Expected StreamWriter to not provide {}()'.format(name)
+
+    def test_reserved_blocks(self):
+        w = c3d.StreamWriter(io.BytesIO(), reserved_blocks=0)
+        w.set_point_labels(['A'])
+        w.set_analog_labels(None)
+        w.append(np.zeros((1, 5)))
+        w.point_group.add_str('NOTE', 'Added after the first frame', 'x' * 600)
+        with self.assertRaises(RuntimeError):
+            w.close()
+
+
+if __name__ == '__main__':
+    unittest.main()